@@ -0,0 +1,206 @@
+"""
+Bid amount analytics: price distribution and outlier detection.
+
+For a tender (or all tenders of a service type) the proposed amounts are kept
+in memory as a sorted NumPy array. Before each use the cache is validated
+with a single indexed `COUNT(*), MAX(id)` query; when bids were only added
+since the last look, just the new rows are fetched and merged into a new
+sorted array, so a tender with thousands of bids never reloads them all.
+A cached series is never modified: requests compute from the snapshot they
+loaded and cache their results on it, and an update swaps in a new one. Bids are
+only ever added (or removed wholesale by archival), which is what makes the
+count/max-id pair a sufficient version.
+
+NumPy is imported on first use so it does not add to worker start-up time.
+"""
+from collections import OrderedDict
+from datetime import date
+import threading
+
+from sqlalchemy import func, or_
+
+from database.models.bid import Bid
+from database.models.tender import Tender
+
+PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
+Z_SCORE_THRESHOLD = 2.0
+IQR_FACTOR = 1.5
+CACHE_SIZE = 1024
+
+
+class AmountSeries:
+    """Bid ids and amounts of one group, sorted by amount. Treat as read-only."""
+
+    def __init__(self, ids, amounts, count, max_id, presorted=False):
+        import numpy as np
+
+        ids = np.asarray(ids, dtype=np.int64)
+        amounts = np.asarray(amounts, dtype=np.float64)
+        if not presorted:
+            order = np.argsort(amounts, kind="stable")
+            ids, amounts = ids[order], amounts[order]
+        self.ids = ids
+        self.amounts = amounts
+        self.count = count
+        self.max_id = max_id
+        # Results computed from this snapshot, keyed by their parameters
+        self.results = {}
+
+    def merged(self, ids, amounts, count, max_id):
+        """A new series with the given rows added."""
+        import numpy as np
+
+        amounts = np.asarray(amounts, dtype=np.float64)
+        order = np.argsort(amounts, kind="stable")
+        amounts = amounts[order]
+        ids = np.asarray(ids, dtype=np.int64)[order]
+        positions = np.searchsorted(self.amounts, amounts, side="right")
+        return AmountSeries(
+            np.insert(self.ids, positions, ids),
+            np.insert(self.amounts, positions, amounts),
+            count,
+            max_id,
+            presorted=True,
+        )
+
+
+class SeriesCache:
+    def __init__(self, maxsize: int = CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, key, query):
+        """Return the up-to-date AmountSeries for `query`, a Query over (Bid.id, Bid.proposed_amount)."""
+        count, max_id = query.with_entities(func.count(Bid.id), func.max(Bid.id)).one()
+        count, max_id = count or 0, max_id or 0
+
+        with self._lock:
+            series = self._entries.get(key)
+            if series is not None:
+                self._entries.move_to_end(key)
+        if series is not None and (series.count, series.max_id) == (count, max_id):
+            return series
+
+        # The snapshot's version is taken from the rows actually read, which
+        # may include bids added after the COUNT/MAX query above
+        fresh = None
+        if series is not None and count > series.count:
+            new_rows = query.filter(Bid.id > series.max_id).all()
+            # Fewer rows than expected means some older bids were removed
+            if series.count + len(new_rows) >= count:
+                ids = [row[0] for row in new_rows]
+                fresh = series.merged(ids, [row[1] for row in new_rows], series.count + len(ids), max(ids))
+        if fresh is None:
+            rows = query.all()
+            ids = [row[0] for row in rows]
+            fresh = AmountSeries(ids, [row[1] for row in rows], len(ids), max(ids, default=0))
+
+        # Every load re-checks the version, so if requests race the one
+        # stored last simply wins
+        with self._lock:
+            self._entries[key] = fresh
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return fresh
+
+
+_cache = SeriesCache()
+
+
+def summarize(amounts, bins: int) -> dict:
+    """Distribution summary of a sorted array of amounts."""
+    import numpy as np
+
+    if amounts.size == 0:
+        return {"count": 0, "percentiles": {}, "histogram": []}
+
+    q1, q3 = np.percentile(amounts, [25, 75])
+    iqr = q3 - q1
+    counts, edges = np.histogram(amounts, bins=bins)
+    return {
+        "count": int(amounts.size),
+        "mean": float(amounts.mean()),
+        "std": float(amounts.std()),
+        "min": float(amounts[0]),
+        "max": float(amounts[-1]),
+        "percentiles": {
+            f"p{p}": float(value) for p, value in zip(PERCENTILES, np.percentile(amounts, PERCENTILES))
+        },
+        "histogram": [
+            {"lower": float(edges[i]), "upper": float(edges[i + 1]), "count": int(counts[i])}
+            for i in range(len(counts))
+        ],
+        "iqr_lower_fence": float(q1 - IQR_FACTOR * iqr),
+        "iqr_upper_fence": float(q3 + IQR_FACTOR * iqr),
+    }
+
+def analyze_bids(series: AmountSeries, summary: dict, min_budget=None, max_budget=None) -> list:
+    """Per-bid z-score, percentile rank and outlier flags, lowest amount first."""
+    import numpy as np
+
+    ids, amounts = series.ids, series.amounts
+    if amounts.size == 0:
+        return []
+
+    std = summary["std"]
+    z_scores = (amounts - summary["mean"]) / std if std > 0 else np.zeros_like(amounts)
+    # Share of bids strictly below each amount
+    ranks = np.searchsorted(amounts, amounts, side="left") / amounts.size * 100
+    low = (amounts < summary["iqr_lower_fence"]) | (z_scores < -Z_SCORE_THRESHOLD)
+    high = (amounts > summary["iqr_upper_fence"]) | (z_scores > Z_SCORE_THRESHOLD)
+
+    return [
+        {
+            "bid_id": int(ids[i]),
+            "proposed_amount": float(amounts[i]),
+            "z_score": float(z_scores[i]),
+            "percentile": float(ranks[i]),
+            "is_outlier": bool(low[i] or high[i]),
+            "is_abnormally_low": bool(low[i]),
+            "below_min_budget": min_budget is not None and bool(amounts[i] < min_budget),
+            "above_max_budget": max_budget is not None and bool(amounts[i] > max_budget),
+        }
+        for i in range(amounts.size)
+    ]
+
+def tender_analytics(session, tender: Tender, bins: int) -> dict:
+    series = _cache.load(
+        ("tender", tender.id),
+        session.query(Bid.id, Bid.proposed_amount).filter(Bid.tender_id == tender.id),
+    )
+    key = ("tender", bins, tender.min_budget, tender.max_budget)
+    if key not in series.results:
+        summary = summarize(series.amounts, bins)
+        series.results[key] = {
+            "tender_id": tender.id,
+            "min_budget": tender.min_budget,
+            "max_budget": tender.max_budget,
+            "distribution": summary,
+            "bids": analyze_bids(series, summary, tender.min_budget, tender.max_budget),
+        }
+    return series.results[key]
+
+def service_type_analytics(session, service_type: str, bins: int, closed_only: bool = True) -> dict:
+    """Distribution of bid amounts across all tenders of `service_type`.
+
+    With `closed_only`, bids on tenders still accepting bids are left out so
+    that the figures cannot be used to undercut competing bids.
+    """
+    query = (
+        session.query(Bid.id, Bid.proposed_amount)
+        .join(Tender, Tender.id == Bid.tender_id)
+        .filter(Tender.service_type == service_type)
+    )
+    if closed_only:
+        query = query.filter(or_(Tender.status != "open", Tender.closing_date < date.today()))
+    series = _cache.load(("service_type", service_type, closed_only), query)
+    key = ("service_type", bins)
+    if key not in series.results:
+        series.results[key] = {
+            "service_type": service_type,
+            "closed_tenders_only": closed_only,
+            "distribution": summarize(series.amounts, bins),
+        }
+    return series.results[key]
@@ -0,0 +1,124 @@
+"""
+Archive tenders whose closing date is more than N days in the past, together
+with their bids, so that the live `tenders`/`bids` tables only hold current data.
+
+Only tenders whose outcome is settled are archived, since archived tenders and
+bids can no longer be updated. A tender past the cutoff is skipped while
+  * any of its bids is still pending, or
+  * it is still "open" and has bids, none of which has been approved.
+
+Each batch is copied into `archived_tenders`/`archived_bids` and deleted from
+the live tables in a single transaction, so the job can be stopped at any
+point and simply re-run to resume where it left off. A pause between batches
+keeps it from starving the API of database time.
+
+Usage (from the backend directory):
+    python archive.py --days 90 --batch-size 100 --pause 0.5
+"""
+import argparse
+from datetime import date, timedelta
+import time
+
+from sqlalchemy import exists, not_, or_
+
+from database.connection import SessionLocal, create_tables, get_engine
+from database.models.archive import ArchivedTender, ArchivedBid
+from database.models.bid import Bid
+from database.models.tender import Tender
+from database.schemas.bid import BidResponse
+from database.schemas.tender import TenderResponse
+from matching import tender_index
+
+DEFAULT_DAYS = 90
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_PAUSE_SECONDS = 0.5
+
+
+def _has_bid(*conditions):
+    return exists().where(Bid.tender_id == Tender.id, *conditions)
+
+def archive_batch(session, cutoff: date, batch_size: int) -> int:
+    """Move up to `batch_size` settled tenders closed before `cutoff`; returns how many were moved."""
+    tenders = (
+        session.query(Tender)
+        .filter(
+            Tender.closing_date < cutoff,
+            not_(_has_bid(Bid.status == "pending")),
+            or_(
+                Tender.status != "open",
+                not_(_has_bid()),
+                _has_bid(Bid.status == "approved"),
+            ),
+        )
+        .order_by(Tender.id)
+        .limit(batch_size)
+        .all()
+    )
+    for tender in tenders:
+        session.add(ArchivedTender(
+            id=tender.id,
+            user_id=tender.user_id,
+            title=tender.title,
+            service_type=tender.service_type,
+            status=tender.status,
+            closing_date=tender.closing_date,
+            data=TenderResponse.model_validate(tender).model_dump(mode="json"),
+        ))
+        for bid in tender.bids:
+            session.add(ArchivedBid(
+                id=bid.id,
+                tender_id=bid.tender_id,
+                user_id=bid.user_id,
+                proposed_amount=bid.proposed_amount,
+                status=bid.status,
+                data=BidResponse.model_validate(bid).model_dump(mode="json"),
+            ))
+        # Cascades to the tender's bids and license rows
+        session.delete(tender)
+    session.commit()
+
+    for tender in tenders:
+        tender_index.remove(tender.id)
+    return len(tenders)
+
+def archive_closed_tenders(
+    older_than_days: int = DEFAULT_DAYS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    pause_seconds: float = DEFAULT_PAUSE_SECONDS,
+    max_batches: int = None,
+) -> int:
+    get_engine()
+    cutoff = date.today() - timedelta(days=older_than_days)
+    total = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        session = SessionLocal()
+        try:
+            moved = archive_batch(session, cutoff, batch_size)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        total += moved
+        batches += 1
+        print(f"Archived {moved} tenders (total {total})")
+        if moved < batch_size:
+            break
+        time.sleep(pause_seconds)
+    return total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Archive tenders closed more than N days ago")
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--pause", type=float, default=DEFAULT_PAUSE_SECONDS,
+                        help="seconds to sleep between batches")
+    parser.add_argument("--max-batches", type=int, default=None)
+    args = parser.parse_args()
+
+    # Make sure the archive tables exist
+    create_tables()
+    archive_closed_tenders(args.days, args.batch_size, args.pause, args.max_batches)
@@ -0,0 +1,147 @@
+"""
+Append-only audit log of status transitions.
+
+Routes call `audit_writer.record(...)` after a successful commit. Events are
+queued in memory and a background thread inserts them into `audit_events` in
+batches, so a request only pays for a queue put. The queue is bounded: when
+it is full, `record` blocks for up to AUDIT_PUT_TIMEOUT seconds and then
+writes the event itself, which slows producers down instead of dropping
+events. Failed inserts (e.g. SQLite "database is locked") are retried with
+exponential backoff; only after AUDIT_WRITE_ATTEMPTS failures is a batch
+given up, and then every event in it is logged. History reads lag writes by
+about AUDIT_FLUSH_SECONDS.
+"""
+from datetime import datetime
+import queue
+import threading
+import time
+
+from sqlalchemy import insert
+
+from config import get_settings
+from database.connection import SessionLocal, get_engine
+from database.models.audit import AuditEvent
+
+_STOP = object()
+
+
+class AuditWriter:
+    def __init__(self, buffer_size: int, batch_size: int, flush_seconds: float, put_timeout: float,
+                 write_attempts: int = 5, retry_seconds: float = 0.2):
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.put_timeout = put_timeout
+        self.write_attempts = write_attempts
+        self.retry_seconds = retry_seconds
+        self._queue = queue.Queue(maxsize=buffer_size)
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Flush everything still buffered and stop the writer thread."""
+        if not self.running:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+        # Events queued by requests that raced with shutdown
+        leftover = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                leftover.append(item)
+        if leftover:
+            self._write(leftover)
+
+    def record(self, entity_type: str, entity_id: int, field: str, old_value, new_value, actor_id: int = None):
+        event = {
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "field": field,
+            "old_value": None if old_value is None else str(old_value),
+            "new_value": None if new_value is None else str(new_value),
+            "actor_id": actor_id,
+            "created_at": datetime.utcnow(),
+        }
+        if not self.running:
+            self._write([event])
+            return
+        try:
+            self._queue.put(event, timeout=self.put_timeout)
+        except queue.Full:
+            self._write([event])
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = []
+            try:
+                item = self._queue.get(timeout=self.flush_seconds)
+            except queue.Empty:
+                continue
+            while True:
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write(batch)
+
+    def _write(self, events):
+        get_engine()
+        for attempt in range(1, self.write_attempts + 1):
+            session = SessionLocal()
+            try:
+                session.execute(insert(AuditEvent), events)
+                session.commit()
+                return
+            except Exception as e:
+                session.rollback()
+                error = e
+            finally:
+                session.close()
+            if attempt < self.write_attempts:
+                delay = self.retry_seconds * 2 ** (attempt - 1)
+                print(f"Error writing {len(events)} audit events (attempt {attempt}), retrying in {delay:.1f}s: {str(error)}")
+                time.sleep(delay)
+
+        print(f"AUDIT EVENTS LOST: giving up on {len(events)} events after {self.write_attempts} attempts: {str(error)}")
+        for event in events:
+            print(f"AUDIT EVENT LOST: {event}")
+
+
+_settings = get_settings()
+audit_writer = AuditWriter(
+    buffer_size=_settings.audit_buffer_size,
+    batch_size=_settings.audit_batch_size,
+    flush_seconds=_settings.audit_flush_seconds,
+    put_timeout=_settings.audit_put_timeout,
+    write_attempts=_settings.audit_write_attempts,
+)
+
+def get_history(session, entity_type: str, entity_id: int):
+    return (
+        session.query(AuditEvent)
+        .filter(AuditEvent.entity_type == entity_type, AuditEvent.entity_id == entity_id)
+        .order_by(AuditEvent.id)
+        .all()
+    )
@@ -0,0 +1,42 @@
+"""
+Microbenchmark for per-request token verification.
+
+Compares a full python-jose decode (signature + claims) against a hit in the
+verified-token cache used by get_current_user.
+
+Usage (from the backend directory):
+    python benchmarks/auth.py --iterations 20000
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tokens import create_access_token, decode_token, get_token_cache
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure per-request auth cost")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    token = create_access_token({"sub": "1", "role": "jmb"})
+    cache = get_token_cache()
+
+    def uncached():
+        cache.clear()
+        decode_token(token)
+
+    def cached():
+        decode_token(token)
+
+    decode_token(token)  # warm imports and the cache
+    for name, fn in (("jose decode (uncached)", uncached), ("cache hit", cached)):
+        seconds = timeit.timeit(fn, number=args.iterations)
+        print(f"{name:24} {seconds / args.iterations * 1e6:8.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
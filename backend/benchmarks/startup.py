@@ -0,0 +1,111 @@
+"""
+Startup benchmark for the backend.
+
+Runs `python -X importtime -c "import main"` in a fresh interpreter a few
+times and reports the cumulative import time of the app plus the slowest
+top-level imports.
+
+Usage (from the backend directory):
+    python benchmarks/startup.py                # print a report
+    python benchmarks/startup.py --save         # record benchmarks/startup_baseline.json
+    python benchmarks/startup.py --check 20     # fail if >20% slower than the baseline
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(BACKEND_DIR, "benchmarks", "startup_baseline.json")
+
+
+def run_importtime(module: str):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    # Lines look like: "import time:       123 |       4567 |   package.module"
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        # Nesting is shown by two spaces of indentation per level, after the
+        # single space that follows the separator
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), int(cumulative_us), depth))
+    return entries
+
+
+def direct_imports(entries, module: str):
+    """Modules imported directly by `module`, with their cumulative time.
+
+    -X importtime prints a module after everything it imports, one level
+    deeper, so the direct imports are the entries one level below `module`
+    between it and the previous entry at its own level or above.
+    """
+    index = next(i for i, (name, _, _) in enumerate(entries) if name == module)
+    depth = entries[index][2]
+    children = []
+    for name, us, child_depth in reversed(entries[:index]):
+        if child_depth <= depth:
+            break
+        if child_depth == depth + 1:
+            children.append((name, us))
+    return children
+
+
+def measure(module: str, runs: int):
+    totals = []
+    entries = []
+    for _ in range(runs):
+        entries = run_importtime(module)
+        totals.append(next(us for name, us, _ in entries if name == module))
+    children = sorted(direct_imports(entries, module), key=lambda item: item[1], reverse=True)
+    return statistics.median(totals), children
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure backend import/start-up time")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--save", action="store_true", help="write the result as the new baseline")
+    parser.add_argument("--check", type=float, metavar="PERCENT",
+                        help="exit non-zero if slower than the baseline by more than PERCENT")
+    args = parser.parse_args()
+
+    median_us, children = measure(args.module, args.runs)
+
+    print(f"import {args.module}: median {median_us / 1000:.1f} ms over {args.runs} runs")
+    if args.top:
+        print(f"\nSlowest imports made by {args.module} (cumulative, last run):")
+        for name, us in children[:args.top]:
+            print(f"  {us / 1000:8.1f} ms  {name}")
+
+    if args.save:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump({"module": args.module, "median_us": median_us}, f, indent=2)
+        print(f"\nBaseline written to {BASELINE_PATH}")
+
+    if args.check is not None:
+        if not os.path.exists(BASELINE_PATH):
+            print(f"\nNo baseline at {BASELINE_PATH}, run with --save first")
+            sys.exit(2)
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)["median_us"]
+        change = (median_us - baseline) / baseline * 100
+        print(f"\nBaseline {baseline / 1000:.1f} ms, change {change:+.1f}%")
+        if change > args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
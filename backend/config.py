@@ -0,0 +1,71 @@
+from functools import lru_cache
+import os
+
+from dotenv import load_dotenv
+
+
+def _read_key(value):
+    if value and not value.lstrip().startswith("-----BEGIN") and os.path.isfile(value):
+        with open(value) as f:
+            return f.read()
+    return value
+
+
+class Settings:
+    """Application settings, read from the environment (and .env) once per process."""
+
+    def __init__(self):
+        load_dotenv()
+
+        # Database configuration
+        self.db_username = os.getenv("DB_USERNAME")
+        self.db_password = os.getenv("DB_PASSWORD")
+        self.db_host = os.getenv("DB_HOST")
+        self.db_port = os.getenv("DB_PORT")
+        self.db_name = os.getenv("DB_NAME")
+        self.database_url = os.getenv("DATABASE_URL") or "sqlite:///example.db"
+
+        # Auth
+        self.secret_key = os.getenv("SECRET_KEY") or "fallback_secret_key"
+        self.algorithm = os.getenv("ALGORITHM") or "HS256"
+        self.access_token_expire_minutes = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES") or 15)
+        self.refresh_token_expire_days = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS") or 7)
+        self.token_cache_size = int(os.getenv("TOKEN_CACHE_SIZE") or 4096)
+        # PEM keys (or paths to PEM files) for asymmetric algorithms such as ES256
+        self.jwt_private_key = _read_key(os.getenv("JWT_PRIVATE_KEY"))
+        self.jwt_public_key = _read_key(os.getenv("JWT_PUBLIC_KEY"))
+
+        # Tender recommendations
+        self.matcher_refresh_seconds = int(os.getenv("MATCHER_REFRESH_SECONDS") or 300)
+
+        # Audit log writer
+        self.audit_buffer_size = int(os.getenv("AUDIT_BUFFER_SIZE") or 10000)
+        self.audit_batch_size = int(os.getenv("AUDIT_BATCH_SIZE") or 500)
+        self.audit_flush_seconds = float(os.getenv("AUDIT_FLUSH_SECONDS") or 1.0)
+        self.audit_put_timeout = float(os.getenv("AUDIT_PUT_TIMEOUT") or 5.0)
+        self.audit_write_attempts = int(os.getenv("AUDIT_WRITE_ATTEMPTS") or 5)
+
+        # Outbound email; the outbox worker only runs when SMTP_HOST is set
+        self.smtp_host = os.getenv("SMTP_HOST")
+        self.smtp_port = int(os.getenv("SMTP_PORT") or 25)
+        self.smtp_username = os.getenv("SMTP_USERNAME")
+        self.smtp_password = os.getenv("SMTP_PASSWORD")
+        self.smtp_starttls = (os.getenv("SMTP_STARTTLS") or "false").lower() in ("1", "true", "yes")
+        self.mail_from = os.getenv("MAIL_FROM") or "no-reply@tender.local"
+        self.outbox_poll_seconds = float(os.getenv("OUTBOX_POLL_SECONDS") or 2.0)
+        self.outbox_batch_size = int(os.getenv("OUTBOX_BATCH_SIZE") or 100)
+        self.outbox_connections = int(os.getenv("OUTBOX_CONNECTIONS") or 4)
+        self.outbox_max_attempts = int(os.getenv("OUTBOX_MAX_ATTEMPTS") or 5)
+        self.outbox_retry_seconds = float(os.getenv("OUTBOX_RETRY_SECONDS") or 30.0)
+
+    @property
+    def admin_database_url(self) -> str:
+        return (
+            f"postgresql+psycopg2://{self.db_username}:{self.db_password}"
+            f"@{self.db_host}:{self.db_port}/postgres"
+        )
+
+
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
@@ -1,41 +1,38 @@
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, declarative_base
 
-from dotenv import load_dotenv
-import os
+from config import get_settings
 
-load_dotenv()
-
-# Database configuration
-DB_USERNAME = os.getenv("DB_USERNAME")
-DB_PASSWORD = os.getenv("DB_PASSWORD")
-DB_HOST = os.getenv("DB_HOST")
-DB_PORT = os.getenv("DB_PORT")
-DB_NAME = os.getenv("DB_NAME")
-# DATABASE_URL = f"postgresql+psycopg2://{DB_USERNAME}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-ADMIN_DATABASE_URL = f"postgresql+psycopg2://{DB_USERNAME}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/postgres"
+# Set up SQLAlchemy Base. The engine is created lazily on first use so that
+# importing the models (or the app) does not open any connections.
+Base = declarative_base()
 
-DATABASE_URL = "sqlite:///example.db"
+# Create a session factory; it is bound to the engine in get_engine()
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
 
-# Set up SQLAlchemy Engine and Base
-engine = create_engine(DATABASE_URL)
-Base = declarative_base()
+_engine = None
 
-# Create a session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def get_engine():
+    global _engine
+    if _engine is None:
+        _engine = create_engine(get_settings().database_url)
+        SessionLocal.configure(bind=_engine)
+    return _engine
 
 def ensure_database_exists():
-    engine = create_engine(ADMIN_DATABASE_URL, isolation_level="AUTOCOMMIT")
+    settings = get_settings()
+    engine = create_engine(settings.admin_database_url, isolation_level="AUTOCOMMIT")
     with engine.connect() as conn:
         result = conn.execute(
             text("SELECT 1 FROM pg_database WHERE datname=:name"),
-            {"name": DB_NAME}
+            {"name": settings.db_name}
         ).scalar()
 
         if not result:
-            conn.execute(text(f'CREATE DATABASE "{DB_NAME}"'))
+            conn.execute(text(f'CREATE DATABASE "{settings.db_name}"'))
 
 def get_db():
+    get_engine()
     db = SessionLocal()
     try:
         yield db
@@ -43,7 +40,7 @@ def get_db():
         db.close()
 
 def create_tables():
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
 
 def drop_tables():
-    Base.metadata.drop_all(bind=engine)
\ No newline at end of file
+    Base.metadata.drop_all(bind=get_engine())
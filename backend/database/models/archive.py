@@ -0,0 +1,29 @@
+from sqlalchemy import Column, String, Integer, Float, Date, DateTime, JSON
+from database.connection import Base
+from datetime import datetime
+
+# Archived rows keep their original ids. The columns used for lookups are
+# stored as real (indexed) columns; the full serialized row lives in `data`.
+
+class ArchivedTender(Base):
+    __tablename__ = "archived_tenders"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, nullable=True, index=True)
+    title = Column(String, nullable=False)
+    service_type = Column(String, nullable=False)
+    status = Column(String, nullable=True)
+    closing_date = Column(Date, nullable=False, index=True)
+    data = Column(JSON, nullable=False)
+    archived_at = Column(DateTime, default=datetime.utcnow)
+
+class ArchivedBid(Base):
+    __tablename__ = "archived_bids"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    tender_id = Column(Integer, nullable=False, index=True)
+    user_id = Column(Integer, nullable=False, index=True)
+    proposed_amount = Column(Float, nullable=False)
+    status = Column(String, nullable=True)
+    data = Column(JSON, nullable=False)
+    archived_at = Column(DateTime, default=datetime.utcnow)
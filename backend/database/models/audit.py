@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from database.connection import Base
+from datetime import datetime
+
+class AuditEvent(Base):
+    __tablename__ = "audit_events"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    entity_type = Column(String, nullable=False)  # tender, bid, user
+    entity_id = Column(Integer, nullable=False)
+    field = Column(String, nullable=False)  # e.g. status, approval_status
+    old_value = Column(String, nullable=True)
+    new_value = Column(String, nullable=True)
+    actor_id = Column(Integer, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_audit_events_entity", "entity_type", "entity_id", "id"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Float, Text, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from database.connection import Base
 from datetime import datetime
@@ -8,7 +8,7 @@ class Bid(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     tender_id = Column(Integer, ForeignKey("tenders.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     
     # Bid details
     proposed_amount = Column(Float, nullable=False)
@@ -23,6 +23,9 @@ class Bid(Base):
     # Status
     status = Column(String, default="pending")  # pending, approved, rejected
     
+    # Optimistic concurrency: every UPDATE is "... WHERE version = <loaded version>"
+    version = Column(Integer, nullable=False, default=1)
+    
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -30,3 +33,9 @@ class Bid(Base):
     # Relationships
     tender = relationship("Tender", back_populates="bids")
     user = relationship("User")
+
+    __table_args__ = (
+        # One bid per contractor per tender; also serves lookups by tender_id alone
+        Index("ix_bids_tender_user", "tender_id", "user_id", unique=True),
+    )
+    __mapper_args__ = {"version_id_col": version}
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, UniqueConstraint
+from database.connection import Base
+
+# Licenses are stored normalized (see matching.normalize_license) so that
+# matching is a plain equality lookup on an indexed column.
+
+class TenderLicense(Base):
+    __tablename__ = "tender_licenses"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    tender_id = Column(Integer, ForeignKey("tenders.id"), nullable=False, index=True)
+    license = Column(String, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("tender_id", "license"),
+        Index("ix_tender_licenses_license_tender", "license", "tender_id"),
+    )
+
+class UserLicense(Base):
+    __tablename__ = "user_licenses"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    license = Column(String, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "license"),
+    )
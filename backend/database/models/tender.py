@@ -1,16 +1,19 @@
 from sqlalchemy import Column, String, Integer, Float, Date, Time, Text, JSON, ForeignKey
 from sqlalchemy.orm import relationship
 from database.connection import Base
+from database.models.bid import Bid
+from database.models.license import TenderLicense
+from database.models.user import User
 
 class Tender(Base):
     __tablename__ = "tenders"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
     
     # Basic Information
     title = Column(String, nullable=False)
-    service_type = Column(String, nullable=False)
+    service_type = Column(String, nullable=False, index=True)
     
     # Property Details
     property_name = Column(String, nullable=True)
@@ -25,7 +28,7 @@ class Tender(Base):
     max_budget = Column(Float, nullable=True)
     
     # Timeline
-    closing_date = Column(Date, nullable=False)
+    closing_date = Column(Date, nullable=False, index=True)
     closing_time = Column(Time, nullable=False)
     site_visit_date = Column(Date, nullable=True)
     site_visit_time = Column(Time, nullable=True)
@@ -50,6 +53,12 @@ class Tender(Base):
     status = Column(String, default="open") # open, closed, awarded
     approval_status = Column(String, default="pending") # pending, approved, rejected
     
+    # Optimistic concurrency: every UPDATE is "... WHERE version = <loaded version>"
+    version = Column(Integer, nullable=False, default=1)
+    
     # Relationships
     creator = relationship("User")
-    bids = relationship("Bid", back_populates="tender", cascade="all, delete-orphan") 
+    bids = relationship("Bid", back_populates="tender", cascade="all, delete-orphan")
+    licenses = relationship("TenderLicense", cascade="all, delete-orphan")
+
+    __mapper_args__ = {"version_id_col": version}
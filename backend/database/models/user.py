@@ -10,7 +10,7 @@ class User(Base):
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String, nullable=False)
-    email = Column(String, nullable=False)
+    email = Column(String, nullable=False, index=True)
     password = Column(String, nullable=False)
     role = Column(String, nullable=False, default="jmb")
     remark = Column(String, nullable=True)
@@ -0,0 +1,40 @@
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+
+class HistogramBin(BaseModel):
+    lower: float
+    upper: float
+    count: int
+
+class BidDistribution(BaseModel):
+    count: int
+    mean: Optional[float] = None
+    std: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    percentiles: Dict[str, float] = {}
+    histogram: List[HistogramBin] = []
+    iqr_lower_fence: Optional[float] = None
+    iqr_upper_fence: Optional[float] = None
+
+class BidAmountAnalysis(BaseModel):
+    bid_id: int
+    proposed_amount: float
+    z_score: float
+    percentile: float
+    is_outlier: bool
+    is_abnormally_low: bool
+    below_min_budget: bool
+    above_max_budget: bool
+
+class TenderBidAnalytics(BaseModel):
+    tender_id: int
+    min_budget: Optional[float] = None
+    max_budget: Optional[float] = None
+    distribution: BidDistribution
+    bids: List[BidAmountAnalysis]
+
+class ServiceTypeBidAnalytics(BaseModel):
+    service_type: str
+    closed_tenders_only: bool
+    distribution: BidDistribution
@@ -0,0 +1,13 @@
+from typing import List
+from datetime import datetime
+from database.schemas.bid import BidResponse
+from database.schemas.tender import TenderResponse
+
+class ArchivedBidResponse(BidResponse):
+    archived_at: datetime
+
+class ArchivedTenderResponse(TenderResponse):
+    archived_at: datetime
+
+class ArchivedTenderDetailResponse(ArchivedTenderResponse):
+    bids: List[ArchivedBidResponse] = []
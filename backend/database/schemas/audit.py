@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+class AuditEventResponse(BaseModel):
+    id: int
+    entity_type: str
+    entity_id: int
+    field: str
+    old_value: Optional[str] = None
+    new_value: Optional[str] = None
+    actor_id: Optional[int] = None
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
@@ -29,6 +29,7 @@ class BidResponse(BidCreateRequest):
     status: str
     created_at: datetime
     updated_at: datetime
+    version: int = 1
     tender: Optional[TenderSummary] = None
     
     class Config:
@@ -40,6 +40,7 @@ class TenderResponse(TenderCreateRequest):
     user_id: int
     status: str
     approval_status: Optional[str] = "pending"
+    version: int = 1
     
     class Config:
         from_attributes = True
@@ -40,9 +40,17 @@ class LoginUser(BaseModel):
 
 class LoginResponse(BaseModel):
     access_token: str
+    refresh_token: str
     token_type: str = "bearer"
     user: LoginUser
 
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+class RefreshResponse(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
+
 class RegisterRequest(BaseModel):
     name: str | None = None
     email: EmailStr
@@ -61,4 +69,10 @@ class RegisterResponse(BaseModel):
     remark: Optional[Json] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class UserLicensesRequest(BaseModel):
+    licenses: List[str]
+
+class UserLicensesResponse(BaseModel):
+    licenses: List[str]
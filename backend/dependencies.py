@@ -1,26 +1,26 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+from typing import Optional
 from database.connection import get_db
 from database.models.user import User
-import os
-from dotenv import load_dotenv
+from tokens import decode_token
 
-load_dotenv()
-
-SECRET_KEY = os.getenv("SECRET_KEY") or "fallback_secret_key"
-ALGORITHM = os.getenv("ALGORITHM") or "HS256"
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="users/login")
 
 def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    # Imported here so that python-jose is only loaded once the first
+    # authenticated request arrives, not at worker start-up.
+    from jose import JWTError
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_token(token)
         user_id = payload.get("sub")
         if user_id is None:
             raise credentials_exception
@@ -37,3 +37,31 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     if user is None:
         raise credentials_exception
     return user
+
+def etag(version: int) -> str:
+    return f'"{version}"'
+
+def check_if_match(if_match: Optional[str], version: int):
+    """Require an If-Match header naming the current version: 428 if it is missing, 412 if stale."""
+    if if_match is None:
+        raise HTTPException(
+            status_code=status.HTTP_428_PRECONDITION_REQUIRED,
+            detail="If-Match header is required, reload the resource and try again",
+        )
+    tags = [tag.strip() for tag in if_match.split(",")]
+    if "*" not in tags and etag(version) not in tags:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Resource has been modified, reload it and try again",
+        )
+
+def commit_or_conflict(session: Session):
+    """Commit, turning a failed version check (a concurrent update won) into a 409."""
+    try:
+        session.commit()
+    except StaleDataError:
+        session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Resource was modified by another request, reload it and try again",
+        )
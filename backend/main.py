@@ -1,20 +1,32 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from database.connection import ensure_database_exists, create_tables
+from audit import audit_writer
+from notifications import outbox_worker
 
-from routers import user, tender, bid
+from routers import user, tender, bid, archive, analytics
 
-# ensure_database_exists()
-# drop_tables()
-create_tables()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # ensure_database_exists()
+    # drop_tables()
+    create_tables()
+    audit_writer.start()
+    outbox_worker.start()
+    yield
+    await outbox_worker.stop()
+    audit_writer.stop()
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 @app.get("/")
@@ -23,4 +35,6 @@ def read_root():
 
 app.include_router(user.router, prefix="/users", tags=["users"])
 app.include_router(tender.router, prefix="/tenders", tags=["tenders"])
-app.include_router(bid.router, prefix="/bids", tags=["bids"])
\ No newline at end of file
+app.include_router(bid.router, prefix="/bids", tags=["bids"])
+app.include_router(archive.router, prefix="/archive", tags=["archive"])
+app.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
\ No newline at end of file
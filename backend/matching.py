@@ -0,0 +1,217 @@
+"""
+Tender recommendation matching.
+
+Keeps an in-memory inverted index of open, approved tenders keyed by required
+license and by service type, so that finding the tenders a contractor
+qualifies for is a handful of set operations instead of a scan over every
+tender. The index is built from the `tender_licenses` join table on first use
+and kept up to date incrementally by the tender routes. Because each worker
+holds its own copy, it is also rebuilt every MATCHER_REFRESH_SECONDS to pick
+up changes made by other workers.
+"""
+from collections import defaultdict
+from datetime import datetime
+import json
+import threading
+import time
+
+from config import get_settings
+from database.connection import SessionLocal, get_engine
+from database.models.license import TenderLicense, UserLicense
+from database.models.tender import Tender
+
+
+def normalize_license(name: str) -> str:
+    return " ".join(name.split()).casefold()
+
+def normalize_service(name: str) -> str:
+    # "Pest Control", "pest-control" and "pestControl" all map to "pestcontrol"
+    return "".join(ch for ch in name.casefold() if ch.isalnum())
+
+def set_tender_licenses(tender: Tender, licenses):
+    """Replace the normalized license rows of `tender` with `licenses`."""
+    normalized = {normalize_license(name) for name in licenses or [] if name and name.strip()}
+    existing = {row.license: row for row in tender.licenses}
+    tender.licenses = [existing.get(name) or TenderLicense(license=name) for name in sorted(normalized)]
+
+# Registration checkbox keys (see signup/contractor-details) and the tender
+# service_type each one covers. "propertyManagement" and "others" have no
+# single tender type.
+REGISTRATION_SERVICES = {
+    "security": "Security",
+    "cleaning": "Cleaning",
+    "landscaping": "Landscaping",
+    "maintenance": "Maintenance",
+}
+
+def user_services(user) -> set:
+    """Normalized tender service types a contractor selected at registration.
+
+    The selection is stored in `remark`. An empty set means "any service": it
+    is returned when nothing was selected, or when a selected option such as
+    "others" does not map to a tender service type.
+    """
+    try:
+        remark = json.loads(user.remark) if user.remark else {}
+    except (TypeError, ValueError):
+        return set()
+    services = remark.get("services") if isinstance(remark, dict) else None
+    if not isinstance(services, dict):
+        return set()
+    selected = [key for key, checked in services.items() if checked]
+    if any(key not in REGISTRATION_SERVICES for key in selected):
+        return set()
+    return {normalize_service(REGISTRATION_SERVICES[key]) for key in selected}
+
+def user_licenses(session, user) -> set:
+    rows = session.query(UserLicense.license).filter(UserLicense.user_id == user.id).all()
+    return {row.license for row in rows}
+
+
+class TenderIndex:
+    def __init__(self, refresh_seconds: int = None):
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        self._built_at = None
+        # Changes made while a build is loading from the database; they are
+        # replayed on top of the freshly built index so none are lost
+        self._pending = None
+        self._clear()
+
+    def _clear(self):
+        self._by_license = defaultdict(set)
+        self._by_service = defaultdict(set)
+        self._unlicensed = set()
+        self._required = {}
+        self._service = {}
+        self._closes_at = {}
+
+    def _add(self, tender_id, service_type, licenses, closes_at):
+        self._remove(tender_id)
+        licenses = frozenset(licenses)
+        service = normalize_service(service_type)
+        self._required[tender_id] = licenses
+        self._service[tender_id] = service
+        self._closes_at[tender_id] = closes_at
+        self._by_service[service].add(tender_id)
+        if not licenses:
+            self._unlicensed.add(tender_id)
+        for name in licenses:
+            self._by_license[name].add(tender_id)
+
+    def _remove(self, tender_id):
+        licenses = self._required.pop(tender_id, None)
+        if licenses is None:
+            return
+        self._closes_at.pop(tender_id, None)
+        self._by_service[self._service.pop(tender_id)].discard(tender_id)
+        self._unlicensed.discard(tender_id)
+        for name in licenses:
+            self._by_license[name].discard(tender_id)
+
+    def build(self):
+        """Reload the index from the database.
+
+        Journaling starts before the load opens its (own) transaction, so any
+        change committed after the load's snapshot is replayed afterwards.
+        """
+        with self._lock:
+            self._pending = []
+
+        get_engine()
+        session = SessionLocal()
+        try:
+            tenders = (
+                session.query(Tender.id, Tender.service_type, Tender.closing_date, Tender.closing_time)
+                .filter(Tender.status == "open", Tender.approval_status == "approved")
+                .all()
+            )
+            licenses = defaultdict(set)
+            rows = (
+                session.query(TenderLicense.tender_id, TenderLicense.license)
+                .join(Tender, Tender.id == TenderLicense.tender_id)
+                .filter(Tender.status == "open", Tender.approval_status == "approved")
+                .all()
+            )
+            for tender_id, name in rows:
+                licenses[tender_id].add(name)
+        except Exception:
+            with self._lock:
+                self._pending = None
+            raise
+        finally:
+            session.close()
+
+        with self._lock:
+            self._clear()
+            for tender in tenders:
+                closes_at = datetime.combine(tender.closing_date, tender.closing_time)
+                self._add(tender.id, tender.service_type, licenses[tender.id], closes_at)
+            for change in self._pending:
+                self._apply(*change)
+            self._pending = None
+            self._built_at = time.monotonic()
+
+    def ensure_built(self):
+        refresh_seconds = self.refresh_seconds
+        if refresh_seconds is None:
+            refresh_seconds = get_settings().matcher_refresh_seconds
+        # One build at a time; requests that waited reuse its result
+        with self._build_lock:
+            with self._lock:
+                fresh = self._built_at is not None and time.monotonic() - self._built_at < refresh_seconds
+            if not fresh:
+                self.build()
+
+    def _apply(self, tender_id, entry):
+        if entry is None:
+            self._remove(tender_id)
+        else:
+            self._add(tender_id, *entry)
+
+    def _record(self, tender_id, entry):
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((tender_id, entry))
+            if self._built_at is not None:
+                self._apply(tender_id, entry)
+
+    def upsert(self, tender: Tender):
+        """Reflect a created/updated tender; closed or unapproved tenders are dropped."""
+        entry = None
+        if tender.status == "open" and tender.approval_status == "approved":
+            closes_at = datetime.combine(tender.closing_date, tender.closing_time)
+            entry = (tender.service_type, [row.license for row in tender.licenses], closes_at)
+        self._record(tender.id, entry)
+
+    def remove(self, tender_id: int):
+        self._record(tender_id, None)
+
+    def match(self, licenses, services=None, now=None) -> set:
+        """Ids of indexed tenders whose required licenses are all in `licenses`.
+
+        If `services` is non-empty, only tenders of those service types are
+        returned. Tenders past their closing date/time are skipped.
+        """
+        now = now or datetime.now()
+        with self._lock:
+            # Count, per tender, how many of its required licenses are held;
+            # a tender qualifies once the count reaches its requirement.
+            held = defaultdict(int)
+            for name in licenses:
+                for tender_id in self._by_license.get(name, ()):
+                    held[tender_id] += 1
+            qualified = {tender_id for tender_id, count in held.items() if count == len(self._required[tender_id])}
+            qualified |= self._unlicensed
+
+            if services:
+                offered = set()
+                for service in services:
+                    offered |= self._by_service.get(service, set())
+                qualified &= offered
+
+            return {tender_id for tender_id in qualified if self._closes_at[tender_id] > now}
+
+
+tender_index = TenderIndex()
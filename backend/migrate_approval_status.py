@@ -3,10 +3,10 @@ Migration script to add approval_status column to tenders table
 and set all existing tenders to 'approved' status
 """
 from sqlalchemy import text
-from database.connection import engine
+from database.connection import get_engine
 
 def migrate():
-    with engine.connect() as conn:
+    with get_engine().connect() as conn:
         # Check if column exists
         result = conn.execute(text("""
             SELECT COUNT(*) 
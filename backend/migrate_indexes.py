@@ -0,0 +1,46 @@
+"""
+Migration script to create any indexes declared on the models that are
+missing from an existing database (create_tables() only adds indexes
+when it creates the table itself), and to drop indexes that a newer
+index has made redundant
+"""
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import IntegrityError
+
+from database.connection import Base, get_engine
+import main  # noqa: F401  (registers every model on Base.metadata)
+
+# (table, index) pairs that are covered by a composite index on the models
+REDUNDANT_INDEXES = [
+    ("bids", "ix_bids_tender_id"),  # prefix of ix_bids_tender_user
+]
+
+def migrate():
+    engine = get_engine()
+    failed = []
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            print(f"Ensuring index {index.name} on {table.name}...")
+            try:
+                index.create(bind=engine, checkfirst=True)
+            except IntegrityError as e:
+                # A unique index over rows that already contain duplicates
+                print(f"Could not create {index.name}: existing rows are not unique, "
+                      f"remove the duplicates and re-run ({e.orig})")
+                failed.append(index.name)
+
+    if failed:
+        # Keep the old indexes until the ones replacing them exist
+        print(f"Migration incomplete, missing indexes: {', '.join(failed)}")
+        raise SystemExit(1)
+
+    inspector = inspect(engine)
+    for table_name, index_name in REDUNDANT_INDEXES:
+        if any(index["name"] == index_name for index in inspector.get_indexes(table_name)):
+            print(f"Dropping redundant index {index_name} on {table_name}...")
+            with engine.begin() as connection:
+                connection.execute(text(f"DROP INDEX {index_name}"))
+    print("Migration completed successfully!")
+
+if __name__ == "__main__":
+    migrate()
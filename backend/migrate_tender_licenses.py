@@ -0,0 +1,25 @@
+"""
+Migration script to create the tender_licenses/user_licenses tables
+and backfill tender_licenses from the required_licenses JSON column
+"""
+from database.connection import SessionLocal, create_tables
+from database.models.tender import Tender
+from matching import set_tender_licenses
+
+def migrate():
+    print("Creating license tables...")
+    create_tables()
+    
+    session = SessionLocal()
+    try:
+        tenders = session.query(Tender).all()
+        print(f"Backfilling licenses for {len(tenders)} tenders...")
+        for tender in tenders:
+            set_tender_licenses(tender, tender.required_licenses)
+        session.commit()
+        print("Migration completed successfully!")
+    finally:
+        session.close()
+
+if __name__ == "__main__":
+    migrate()
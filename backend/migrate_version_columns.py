@@ -0,0 +1,32 @@
+"""
+Migration script to add the optimistic-concurrency version column
+to the tenders and bids tables
+"""
+from sqlalchemy import text
+from database.connection import get_engine
+
+def migrate():
+    with get_engine().connect() as conn:
+        for table in ("tenders", "bids"):
+            # Check if column exists
+            result = conn.execute(text(f"""
+                SELECT COUNT(*) 
+                FROM pragma_table_info('{table}') 
+                WHERE name='version'
+            """))
+            
+            if result.scalar() == 0:
+                print(f"Adding version column to {table}...")
+                conn.execute(text(f"""
+                    ALTER TABLE {table} 
+                    ADD COLUMN version INTEGER NOT NULL DEFAULT 1
+                """))
+                conn.commit()
+                print("Column added successfully")
+            else:
+                print(f"{table}.version column already exists")
+        
+        print("Migration completed successfully!")
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,211 @@
+"""
+Email notifications via a transactional outbox.
+
+Routes call `enqueue_email(session, ...)` before they commit, so the message is
+stored in `outbox_emails` in the same transaction as the change it describes
+and the request only pays for one extra insert. `OutboxWorker` runs as an
+asyncio task in the app process: it claims due messages in batches, sends
+them over a small pool of persistent SMTP connections and retries failures
+with exponential backoff until OUTBOX_MAX_ATTEMPTS is reached.
+
+For local testing run an SMTP stand-in such as
+    python -m aiosmtpd -n -l localhost:8025
+and start the API with SMTP_HOST=localhost SMTP_PORT=8025.
+"""
+import asyncio
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+import smtplib
+
+from config import get_settings
+from database.connection import SessionLocal, get_engine
+from database.models.outbox import OutboxEmail
+
+
+def enqueue_email(session, recipient: str, subject: str, body: str):
+    """Add a message to the outbox; it is sent once `session` commits."""
+    if not recipient:
+        return
+    session.add(OutboxEmail(recipient=recipient, subject=subject, body=body))
+
+
+class SMTPSender:
+    """One persistent SMTP connection, reopened when the server drops it."""
+
+    def __init__(self, settings):
+        self.settings = settings
+        self._smtp = None
+
+    def _connect(self):
+        smtp = smtplib.SMTP(self.settings.smtp_host, self.settings.smtp_port, timeout=30)
+        if self.settings.smtp_starttls:
+            smtp.starttls()
+        if self.settings.smtp_username:
+            smtp.login(self.settings.smtp_username, self.settings.smtp_password)
+        self._smtp = smtp
+
+    def _send(self, message: EmailMessage):
+        if self._smtp is None:
+            self._connect()
+        try:
+            self._smtp.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            self._connect()
+            self._smtp.send_message(message)
+
+    def send_batch(self, emails):
+        """Send each (id, recipient, subject, body); returns {id: error or None}."""
+        results = {}
+        for email_id, recipient, subject, body in emails:
+            message = EmailMessage()
+            message["From"] = self.settings.mail_from
+            message["To"] = recipient
+            message["Subject"] = subject
+            message.set_content(body)
+            try:
+                self._send(message)
+                results[email_id] = None
+            except (smtplib.SMTPException, OSError) as e:
+                results[email_id] = str(e) or type(e).__name__
+                if not isinstance(e, smtplib.SMTPRecipientsRefused):
+                    self.close()
+        return results
+
+    def close(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp = None
+
+
+class OutboxWorker:
+    def __init__(self, settings=None):
+        self.settings = settings or get_settings()
+        self._senders = [SMTPSender(self.settings) for _ in range(max(1, self.settings.outbox_connections))]
+        self._task = None
+
+    def start(self):
+        if self.settings.smtp_host and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        for sender in self._senders:
+            sender.close()
+
+    async def _run(self):
+        while True:
+            try:
+                sent = await self.drain_once()
+            except Exception as e:
+                print(f"Outbox worker error: {str(e)}")
+                sent = 0
+            # Keep going straight away while there is a backlog
+            if sent < self.settings.outbox_batch_size:
+                await asyncio.sleep(self.settings.outbox_poll_seconds)
+
+    async def drain_once(self) -> int:
+        emails = await asyncio.to_thread(self._claim_batch)
+        if not emails:
+            return 0
+
+        # Spread the batch over the connection pool
+        chunks = [emails[i::len(self._senders)] for i in range(len(self._senders))]
+        results = {}
+        for chunk_results in await asyncio.gather(*(
+            asyncio.to_thread(sender.send_batch, chunk)
+            for sender, chunk in zip(self._senders, chunks) if chunk
+        )):
+            results.update(chunk_results)
+
+        await asyncio.to_thread(self._record_results, results)
+        return len(emails)
+
+    def _claim_batch(self):
+        """Mark a batch of due messages as sending and return their contents.
+
+        A claim is a lease: if this process dies mid-send, the message becomes
+        due again once `next_attempt_at` passes and another worker retries it.
+        The attempt is counted when it is claimed, so a message that keeps
+        crashing the worker still ends up "failed" after OUTBOX_MAX_ATTEMPTS.
+        """
+        get_engine()
+        session = SessionLocal()
+        try:
+            now = datetime.utcnow()
+            lease_until = now + timedelta(minutes=5)
+            candidates = (
+                session.query(OutboxEmail.id, OutboxEmail.attempts)
+                .filter(OutboxEmail.status.in_(["pending", "sending"]), OutboxEmail.next_attempt_at <= now)
+                .order_by(OutboxEmail.next_attempt_at)
+                .limit(self.settings.outbox_batch_size)
+                .all()
+            )
+            claimed = []
+            for email_id, attempts in candidates:
+                if attempts >= self.settings.outbox_max_attempts:
+                    # Only reachable through expired leases: every attempt was claimed
+                    # but the worker never reported back
+                    changes = {"status": "failed", "last_error": "Send did not complete (lease expired)"}
+                else:
+                    changes = {"status": "sending", "next_attempt_at": lease_until, "attempts": attempts + 1}
+                # Compare-and-set so two workers never claim the same message
+                updated = (
+                    session.query(OutboxEmail)
+                    .filter(
+                        OutboxEmail.id == email_id,
+                        OutboxEmail.attempts == attempts,
+                        OutboxEmail.next_attempt_at <= now,
+                    )
+                    .update(changes, synchronize_session=False)
+                )
+                if updated and changes["status"] == "sending":
+                    claimed.append(email_id)
+            session.commit()
+
+            if not claimed:
+                return []
+            rows = (
+                session.query(OutboxEmail.id, OutboxEmail.recipient, OutboxEmail.subject, OutboxEmail.body)
+                .filter(OutboxEmail.id.in_(claimed))
+                .all()
+            )
+            return [tuple(row) for row in rows]
+        finally:
+            session.close()
+
+    def _record_results(self, results):
+        session = SessionLocal()
+        try:
+            now = datetime.utcnow()
+            emails = session.query(OutboxEmail).filter(OutboxEmail.id.in_(list(results))).all()
+            for email in emails:
+                error = results[email.id]
+                # email.attempts was already incremented when it was claimed
+                if error is None:
+                    email.status = "sent"
+                    email.sent_at = now
+                    email.last_error = None
+                elif email.attempts >= self.settings.outbox_max_attempts:
+                    email.status = "failed"
+                    email.last_error = error
+                else:
+                    email.status = "pending"
+                    email.last_error = error
+                    backoff = self.settings.outbox_retry_seconds * 2 ** (email.attempts - 1)
+                    email.next_attempt_at = now + timedelta(seconds=backoff)
+            session.commit()
+        finally:
+            session.close()
+
+
+outbox_worker = OutboxWorker()
@@ -0,0 +1,409 @@
+"""
+Query-plan regression check for every API route.
+
+Seeds a throwaway database (SQLite by default, or DATABASE_URL if it points
+at an empty Postgres database), calls every route registered from `routers/`
+through FastAPI's TestClient and records each SELECT/UPDATE/DELETE it emits.
+Each statement is then run through `EXPLAIN QUERY PLAN` (SQLite) or `EXPLAIN`
+(Postgres). The check fails when:
+
+  * a route in routers/ has no entry in ROUTE_CALLS (so new routes get covered),
+  * a route call returns an error status,
+  * a plan does a full table scan of a large table that is not in ALLOWED_SCANS.
+
+Plans are written to query_plans.json, which is committed so that index
+regressions show up as a diff in review. Requires httpx (for TestClient).
+
+Usage (from the backend directory):
+    python query_plans.py            # check against the committed snapshot
+    python query_plans.py --update   # rewrite query_plans.json
+"""
+import argparse
+from datetime import date, time, timedelta
+import json
+import os
+import re
+import sys
+import tempfile
+
+SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "query_plans.json")
+
+# Tables with at least this many seeded rows count as large
+LARGE_TABLE_ROWS = 1000
+
+SEED_USERS = 1500
+SEED_TENDERS = 3000
+SEED_BIDS = 10000
+SEED_ARCHIVED_TENDERS = 2000
+SEED_ARCHIVED_BIDS = 5000
+SEED_AUDIT_EVENTS = 5000
+
+# Fixed ids of the seeded rows the route calls act on
+OWNER_ID, CONTRACTOR_ID, ADMIN_ID, UNREGISTERED_ID = 1, 2, 3, 4
+OWNER_TENDER_ID, OTHER_TENDER_ID, OWNER_BID_ID = 1, 2, 1
+ARCHIVED_TENDER_ID = 1_000_001
+
+# (route, table) pairs where a full scan is intended, e.g. unfiltered listings
+ALLOWED_SCANS = {
+    ("GET /users/", "users"),
+    ("GET /tenders/", "tenders"),
+    # The recommendation index is (re)built from every open, approved tender
+    ("GET /tenders/recommended", "tenders"),
+    ("GET /tenders/recommended", "tender_licenses"),
+}
+
+TENDER_BODY = {
+    "title": "Security Services Contract",
+    "service_type": "Security",
+    "scope_of_work": "24/7 guarding",
+    "contract_period_months": 12,
+    "min_budget": 10000,
+    "max_budget": 20000,
+    "closing_date": (date.today() + timedelta(days=30)).isoformat(),
+    "closing_time": "17:00:00",
+    "contact_person": "Owner",
+    "contact_email": "owner@example.com",
+    "contact_phone": "0123456789",
+    "required_licenses": ["PPKBM License"],
+    "evaluation_criteria": [{"criteria": "Price", "weight": 100}],
+}
+
+# Every route in routers/, called once as the given user. Reads come first so
+# that they see the seeded data rather than the effects of the writes.
+ROUTE_CALLS = [
+    {"route": "GET /users/me", "user": OWNER_ID},
+    {"route": "GET /users/me/licenses", "user": CONTRACTOR_ID},
+    {"route": "GET /users/", "user": None},
+    {"route": "GET /tenders/", "user": CONTRACTOR_ID},
+    {"route": "GET /tenders/recommended", "user": CONTRACTOR_ID},
+    {"route": "GET /tenders/{tender_id}", "user": CONTRACTOR_ID, "params": {"tender_id": OWNER_TENDER_ID}},
+    {"route": "GET /tenders/{tender_id}/history", "user": OWNER_ID, "params": {"tender_id": OWNER_TENDER_ID}},
+    {"route": "GET /bids/tender/{tender_id}", "user": OWNER_ID, "params": {"tender_id": OWNER_TENDER_ID}},
+    {"route": "GET /bids/my-bids", "user": CONTRACTOR_ID},
+    {"route": "GET /bids/{bid_id}", "user": CONTRACTOR_ID, "params": {"bid_id": OWNER_BID_ID}},
+    {"route": "GET /bids/{bid_id}/history", "user": OWNER_ID, "params": {"bid_id": OWNER_BID_ID}},
+    {"route": "GET /archive/tenders", "user": ADMIN_ID},
+    {"route": "GET /archive/tenders/{tender_id}", "user": OWNER_ID, "params": {"tender_id": ARCHIVED_TENDER_ID}},
+    {"route": "GET /archive/my-bids", "user": CONTRACTOR_ID},
+    {"route": "GET /analytics/tenders/{tender_id}", "user": OWNER_ID, "params": {"tender_id": OWNER_TENDER_ID}},
+    {"route": "GET /analytics/service-types/{service_type}", "user": OWNER_ID, "params": {"service_type": "Security"}},
+    {"route": "POST /users/login", "user": None, "data": {"username": "user1@example.com", "password": "password"}},
+    {"route": "POST /users/refresh", "user": None, "refresh_token_for": OWNER_ID},
+    {"route": "POST /users/register", "user": None,
+     "json": {"name": "New", "email": "new@example.com", "password": "password", "role": "contractor"}},
+    {"route": "POST /users/register/update", "user": None,
+     "json": {"email": f"user{UNREGISTERED_ID}@example.com", "remark": {"services": {"security": True}}}},
+    {"route": "PUT /users/me/licenses", "user": CONTRACTOR_ID, "json": {"licenses": ["PPKBM License"]}},
+    {"route": "POST /tenders/create", "user": OWNER_ID, "json": TENDER_BODY},
+    {"route": "PUT /tenders/{tender_id}", "user": OWNER_ID, "params": {"tender_id": OWNER_TENDER_ID},
+     "headers": {"If-Match": '"1"'}, "json": TENDER_BODY},
+    {"route": "PUT /tenders/{tender_id}/approval", "user": ADMIN_ID, "params": {"tender_id": OWNER_TENDER_ID},
+     "json": {"approval_status": "approved"}},
+    {"route": "POST /bids/", "user": CONTRACTOR_ID,
+     "json": {"tender_id": OTHER_TENDER_ID, "proposed_amount": 15000, "company_name": "Contractor Sdn Bhd"}},
+    {"route": "PUT /bids/{bid_id}/status", "user": OWNER_ID, "params": {"bid_id": OWNER_BID_ID},
+     "headers": {"If-Match": '"1"'}, "json": {"status": "approved"}},
+]
+
+
+def seed(session):
+    from sqlalchemy import insert
+    from database.models.archive import ArchivedTender, ArchivedBid
+    from database.models.audit import AuditEvent
+    from database.models.bid import Bid
+    from database.models.license import TenderLicense, UserLicense
+    from database.models.tender import Tender
+    from database.models.user import User
+    from routers.user import hash_password
+
+    password = hash_password("password")
+    roles = {OWNER_ID: "jmb", CONTRACTOR_ID: "contractor", ADMIN_ID: "admin"}
+    session.execute(insert(User), [
+        {
+            "id": i,
+            "name": f"User {i}",
+            "email": f"user{i}@example.com",
+            "password": password,
+            "role": roles.get(i, "contractor" if i % 2 else "jmb"),
+            "remark": json.dumps({"services": {"security": True, "cleaning": i % 3 == 0}}),
+            "status": 0 if i == UNREGISTERED_ID else 1,
+        }
+        for i in range(1, SEED_USERS + 1)
+    ])
+
+    services = ["Security", "Cleaning", "Maintenance", "Landscaping", "Pest Control"]
+    licenses = ["ppkbm license", "cidb registration", "bomba certificate"]
+    closing = date.today() + timedelta(days=30)
+    session.execute(insert(Tender), [
+        {
+            "id": i,
+            "user_id": OWNER_ID if i == OWNER_TENDER_ID else 5 + i % (SEED_USERS - 5),
+            "title": f"Tender {i}",
+            "service_type": services[i % len(services)],
+            "scope_of_work": "Scope",
+            "contract_period_months": 12,
+            "min_budget": 1000.0,
+            "max_budget": 5000.0,
+            "closing_date": closing - timedelta(days=i % 60),
+            "closing_time": time(17, 0),
+            "contact_person": "Contact",
+            "contact_email": "contact@example.com",
+            "contact_phone": "0123456789",
+            "required_licenses": [licenses[i % len(licenses)]],
+            "evaluation_criteria": [],
+            "tender_documents": [],
+            "status": "open" if i % 4 else "closed",
+            "approval_status": "approved" if i % 5 else "pending",
+        }
+        for i in range(1, SEED_TENDERS + 1)
+    ])
+    session.execute(insert(TenderLicense), [
+        {"tender_id": i, "license": licenses[i % len(licenses)]} for i in range(1, SEED_TENDERS + 1)
+    ])
+    session.execute(insert(UserLicense), [
+        {"user_id": CONTRACTOR_ID, "license": name} for name in licenses[:2]
+    ])
+
+    def bid_row(i, tender_id, user_id):
+        return {
+            "id": i,
+            "tender_id": tender_id,
+            "user_id": user_id,
+            "proposed_amount": 1000.0 + (i * 37) % 4000,
+            "company_name": f"Company {user_id}",
+            "status": "pending",
+        }
+
+    bids = [bid_row(OWNER_BID_ID, OWNER_TENDER_ID, CONTRACTOR_ID)]
+    # Filler bids come from users other than the contractor, so the contractor
+    # can still bid on OTHER_TENDER_ID
+    bids += [
+        bid_row(i, 1 + i % SEED_TENDERS, 5 + i % (SEED_USERS - 5))
+        for i in range(2, SEED_BIDS + 1)
+    ]
+    session.execute(insert(Bid), bids)
+
+    session.execute(insert(ArchivedTender), [
+        {
+            "id": ARCHIVED_TENDER_ID + i,
+            "user_id": OWNER_ID if i == 0 else 5 + i % (SEED_USERS - 5),
+            "title": f"Archived tender {i}",
+            "service_type": services[i % len(services)],
+            "status": "closed",
+            "closing_date": date.today() - timedelta(days=200 + i % 300),
+            "data": {
+                **TENDER_BODY,
+                "id": ARCHIVED_TENDER_ID + i,
+                "user_id": OWNER_ID,
+                "status": "closed",
+                "approval_status": "approved",
+            },
+        }
+        for i in range(SEED_ARCHIVED_TENDERS)
+    ])
+    session.execute(insert(ArchivedBid), [
+        {
+            "id": 1_000_000 + i,
+            "tender_id": ARCHIVED_TENDER_ID + i % SEED_ARCHIVED_TENDERS,
+            "user_id": CONTRACTOR_ID if i % 50 == 0 else 5 + i % (SEED_USERS - 5),
+            "proposed_amount": 1000.0,
+            "status": "rejected",
+            "data": {
+                "id": 1_000_000 + i,
+                "tender_id": ARCHIVED_TENDER_ID + i % SEED_ARCHIVED_TENDERS,
+                "user_id": CONTRACTOR_ID,
+                "proposed_amount": 1000.0,
+                "company_name": "Company",
+                "status": "rejected",
+                "created_at": "2025-01-01T00:00:00",
+                "updated_at": "2025-01-01T00:00:00",
+            },
+        }
+        for i in range(SEED_ARCHIVED_BIDS)
+    ])
+    session.execute(insert(AuditEvent), [
+        {
+            "entity_type": "bid" if i % 2 else "tender",
+            "entity_id": 1 + i % SEED_TENDERS,
+            "field": "status",
+            "old_value": "pending",
+            "new_value": "approved",
+            "actor_id": OWNER_ID,
+        }
+        for i in range(SEED_AUDIT_EVENTS)
+    ])
+    session.commit()
+
+    if session.bind.dialect.name == "postgresql":
+        # Rows were inserted with explicit ids; move the sequences past them
+        from sqlalchemy import text
+        for table in ("users", "tenders", "bids", "tender_licenses", "user_licenses", "audit_events"):
+            session.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT MAX(id) FROM {table}))"
+            ))
+        session.commit()
+
+
+class StatementRecorder:
+    """Collects the statements emitted while `route` is set."""
+
+    def __init__(self):
+        self.route = None
+        self.statements = {}
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if self.route is None or executemany:
+            return
+        if not statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+            return
+        self.statements.setdefault(self.route, []).append((statement, parameters))
+
+
+def explain(engine, statement, parameters):
+    """Return the plan of `statement` as a list of lines."""
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        if engine.dialect.name == "sqlite":
+            cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters)
+            return [row[-1] for row in cursor.fetchall()]
+        cursor.execute("EXPLAIN " + statement, parameters)
+        return [row[0] for row in cursor.fetchall()]
+    finally:
+        raw.rollback()
+        raw.close()
+
+def scanned_tables(dialect: str, plan):
+    """Tables read with a full scan (no index) according to `plan`."""
+    tables = set()
+    for line in plan:
+        if dialect == "sqlite":
+            # e.g. "SCAN tenders" or, on older SQLite, "SCAN TABLE tenders"
+            match = re.match(r"SCAN (?:TABLE )?(\w+)", line.strip())
+            if match and "USING" not in line:
+                tables.add(match.group(1))
+        else:
+            match = re.search(r"Seq Scan on (\w+)", line)
+            if match:
+                tables.add(match.group(1))
+    return tables
+
+def table_sizes(engine):
+    from sqlalchemy import inspect, text
+
+    with engine.connect() as conn:
+        return {
+            table: conn.execute(text(f'SELECT COUNT(*) FROM "{table}"')).scalar()
+            for table in inspect(engine).get_table_names()
+        }
+
+
+def run():
+    from fastapi.routing import APIRoute
+    from fastapi.testclient import TestClient
+    from sqlalchemy import event
+
+    from database.connection import SessionLocal, get_engine
+    from main import app
+    from tokens import create_access_token, create_refresh_token
+
+    engine = get_engine()
+    errors = []
+
+    router_routes = {
+        f"{method} {route.path}"
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.endpoint.__module__.startswith("routers.")
+        for method in route.methods
+    }
+    covered = {call["route"] for call in ROUTE_CALLS}
+    for route in sorted(router_routes - covered):
+        errors.append(f"{route}: no entry in ROUTE_CALLS")
+
+    recorder = StatementRecorder()
+    with TestClient(app) as client:
+        session = SessionLocal()
+        try:
+            seed(session)
+        finally:
+            session.close()
+        sizes = table_sizes(engine)
+
+        event.listen(engine, "before_cursor_execute", recorder)
+        for call in ROUTE_CALLS:
+            method, path = call["route"].split(" ", 1)
+            headers = dict(call.get("headers", {}))
+            if call["user"] is not None:
+                token = create_access_token({"sub": str(call["user"])})
+                headers["Authorization"] = f"Bearer {token}"
+            body = call.get("json")
+            if "refresh_token_for" in call:
+                body = {"refresh_token": create_refresh_token({"sub": str(call["refresh_token_for"])})}
+
+            recorder.route = call["route"]
+            response = client.request(
+                method,
+                path.format(**call.get("params", {})),
+                headers=headers,
+                json=body,
+                data=call.get("data"),
+            )
+            recorder.route = None
+            if response.status_code >= 400:
+                errors.append(f"{call['route']}: returned {response.status_code} {response.text}")
+        event.remove(engine, "before_cursor_execute", recorder)
+
+    plans = {}
+    for route, statements in sorted(recorder.statements.items()):
+        route_plans = []
+        seen = set()
+        for statement, parameters in statements:
+            if statement in seen:
+                continue
+            seen.add(statement)
+            plan = explain(engine, statement, parameters)
+            route_plans.append({"statement": " ".join(statement.split()), "plan": plan})
+            for table in scanned_tables(engine.dialect.name, plan):
+                if sizes.get(table, 0) >= LARGE_TABLE_ROWS and (route, table) not in ALLOWED_SCANS:
+                    errors.append(f"{route}: full scan of {table} ({sizes[table]} rows)\n    {statement}")
+        plans[route] = route_plans
+    return plans, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check query plans of every API route")
+    parser.add_argument("--update", action="store_true", help=f"rewrite {os.path.basename(SNAPSHOT_PATH)}")
+    args = parser.parse_args()
+
+    if not (os.getenv("DATABASE_URL") or "").startswith("postgresql"):
+        db_path = os.path.join(tempfile.mkdtemp(), "query_plans.db")
+        os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    # Keep the outbox worker from trying to send mail (an empty value also
+    # stops load_dotenv() from filling it in from .env)
+    os.environ["SMTP_HOST"] = ""
+
+    plans, errors = run()
+
+    if args.update:
+        with open(SNAPSHOT_PATH, "w") as f:
+            json.dump(plans, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Wrote {SNAPSHOT_PATH}")
+    elif os.path.exists(SNAPSHOT_PATH):
+        with open(SNAPSHOT_PATH) as f:
+            snapshot = json.load(f)
+        for route in sorted(set(snapshot) | set(plans)):
+            if snapshot.get(route) != plans.get(route):
+                errors.append(f"{route}: plan differs from {os.path.basename(SNAPSHOT_PATH)} (run with --update and review the diff)")
+    else:
+        errors.append(f"{SNAPSHOT_PATH} not found (run with --update)")
+
+    for error in errors:
+        print(f"FAIL {error}")
+    if errors:
+        sys.exit(1)
+    print(f"OK: {sum(len(p) for p in plans.values())} statements across {len(plans)} routes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from database.connection import get_db
+from database.models.tender import Tender
+from database.schemas.analytics import TenderBidAnalytics, ServiceTypeBidAnalytics
+from database.models.user import User
+from dependencies import get_current_user
+from analytics import tender_analytics, service_type_analytics
+
+router = APIRouter()
+
+@router.get("/tenders/{tender_id}", response_model=TenderBidAnalytics)
+def get_tender_bid_analytics(
+    tender_id: int,
+    bins: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_db)
+):
+    tender = session.query(Tender).filter(Tender.id == tender_id).first()
+    if not tender:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tender not found"
+        )
+    
+    # Per-bid figures are only for the tender owner (and admins)
+    if tender.user_id != current_user.id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view analytics for this tender"
+        )
+    
+    return tender_analytics(session, tender, bins)
+
+@router.get("/service-types/{service_type}", response_model=ServiceTypeBidAnalytics)
+def get_service_type_bid_analytics(
+    service_type: str,
+    bins: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_db)
+):
+    # Only admins may see bids on tenders that are still open for bidding
+    return service_type_analytics(session, service_type, bins, closed_only=current_user.role != "admin")
@@ -0,0 +1,67 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from database.connection import get_db
+from database.models.archive import ArchivedTender, ArchivedBid
+from database.schemas.archive import ArchivedTenderResponse, ArchivedTenderDetailResponse, ArchivedBidResponse
+from database.models.user import User
+from dependencies import get_current_user
+from typing import List, Optional
+
+router = APIRouter()
+
+def _with_archived_at(row):
+    return {**row.data, "archived_at": row.archived_at}
+
+@router.get("/tenders", response_model=List[ArchivedTenderResponse])
+def list_archived_tenders(
+    user_id: Optional[int] = None,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_db)
+):
+    query = session.query(ArchivedTender)
+    
+    # Admins can browse the whole archive, everyone else only their own tenders
+    if current_user.role != "admin":
+        user_id = current_user.id
+    if user_id:
+        query = query.filter(ArchivedTender.user_id == user_id)
+    
+    tenders = (
+        query.order_by(ArchivedTender.closing_date.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    return [_with_archived_at(tender) for tender in tenders]
+
+@router.get("/tenders/{tender_id}", response_model=ArchivedTenderDetailResponse)
+def get_archived_tender(
+    tender_id: int,
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_db)
+):
+    tender = session.query(ArchivedTender).filter(ArchivedTender.id == tender_id).first()
+    if not tender:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Archived tender not found"
+        )
+    
+    if tender.user_id != current_user.id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view this tender"
+        )
+    
+    bids = session.query(ArchivedBid).filter(ArchivedBid.tender_id == tender_id).all()
+    return {**_with_archived_at(tender), "bids": [_with_archived_at(bid) for bid in bids]}
+
+@router.get("/my-bids", response_model=List[ArchivedBidResponse])
+def get_my_archived_bids(
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_db)
+):
+    bids = session.query(ArchivedBid).filter(ArchivedBid.user_id == current_user.id).all()
+    return [_with_archived_at(bid) for bid in bids]
@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from database.connection import get_db
 from database.models.bid import Bid
 from database.models.tender import Tender
 from database.schemas.bid import BidCreateRequest, BidResponse, BidStatusUpdate
+from database.schemas.audit import AuditEventResponse
 from database.models.user import User
-from dependencies import get_current_user
+from dependencies import get_current_user, etag, check_if_match, commit_or_conflict
+from audit import audit_writer, get_history
+from notifications import enqueue_email
 from typing import List, Optional
 
 router = APIRouter()
@@ -49,7 +53,23 @@ def create_bid(
     )
     
     session.add(new_bid)
-    session.commit()
+    
+    # Notify the tender owner
+    enqueue_email(
+        session,
+        tender.contact_email,
+        f"New bid received for \"{tender.title}\"",
+        f"{new_bid.company_name} has submitted a bid of {new_bid.proposed_amount:,.2f} for \"{tender.title}\".",
+    )
+    try:
+        session.commit()
+    except IntegrityError:
+        # A concurrent request from the same user got in first (ix_bids_tender_user)
+        session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="You have already submitted a bid for this tender"
+        )
     session.refresh(new_bid)
     
     return new_bid
@@ -93,6 +113,8 @@ def get_my_bids(
 def update_bid_status(
     bid_id: int,
     status_update: BidStatusUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_db)
 ):
@@ -118,15 +140,54 @@ def update_bid_status(
             detail="Invalid status. Must be 'pending', 'approved', or 'rejected'"
         )
     
+    check_if_match(if_match, bid.version)
+    
+    previous_status = bid.status
     bid.status = status_update.status
-    session.commit()
+    
+    # Notify the bid submitter
+    if bid.status != previous_status:
+        enqueue_email(
+            session,
+            bid.user.email,
+            f"Your bid for \"{tender.title}\" has been {bid.status}",
+            f"The status of your bid for \"{tender.title}\" changed from {previous_status} to {bid.status}.",
+        )
+    commit_or_conflict(session)
     session.refresh(bid)
+    if bid.status != previous_status:
+        audit_writer.record("bid", bid.id, "status", previous_status, bid.status, current_user.id)
     
+    response.headers["ETag"] = etag(bid.version)
     return bid
 
+@router.get("/{bid_id}/history", response_model=List[AuditEventResponse])
+def get_bid_history(
+    bid_id: int,
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_db)
+):
+    bid = session.query(Bid).filter(Bid.id == bid_id).first()
+    if not bid:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Bid not found"
+        )
+    
+    # User must be bid owner or tender owner
+    tender = session.query(Tender).filter(Tender.id == bid.tender_id).first()
+    if bid.user_id != current_user.id and tender.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view the history of this bid"
+        )
+    
+    return get_history(session, "bid", bid_id)
+
 @router.get("/{bid_id}", response_model=BidResponse)
 def get_bid(
     bid_id: int,
+    response: Response,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_db)
 ):
@@ -145,4 +206,5 @@ def get_bid(
             detail="Not authorized to view this bid"
         )
     
+    response.headers["ETag"] = etag(bid.version)
     return bid
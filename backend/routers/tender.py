@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from database.connection import get_db
 from database.models.tender import Tender
 from database.schemas.tender import TenderCreateRequest, TenderResponse
+from database.schemas.audit import AuditEventResponse
 from database.models.user import User
-from dependencies import get_current_user
+from dependencies import get_current_user, etag, check_if_match, commit_or_conflict
+from audit import audit_writer, get_history
+from notifications import enqueue_email
+from matching import tender_index, set_tender_licenses, user_licenses, user_services
 from typing import List, Optional
 
 router = APIRouter()
@@ -38,10 +42,12 @@ def create_tender(
         tender_fee=tender_data.tender_fee,
         tender_documents=tender_data.tender_documents
     )
+    set_tender_licenses(new_tender, tender_data.required_licenses)
     
     session.add(new_tender)
     session.commit()
     session.refresh(new_tender)
+    tender_index.upsert(new_tender)
     
     return new_tender
 
@@ -59,9 +65,37 @@ def list_tenders(
     tenders = query.all()
     return tenders
 
+@router.get("/recommended", response_model=List[TenderResponse])
+def recommended_tenders(
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_db)
+):
+    tender_index.ensure_built()
+    tender_ids = tender_index.match(
+        user_licenses(session, current_user),
+        user_services(current_user),
+    )
+    if not tender_ids:
+        return []
+    
+    # Re-check status in SQL in case another worker changed it since the
+    # index was last refreshed
+    tenders = (
+        session.query(Tender)
+        .filter(
+            Tender.id.in_(tender_ids),
+            Tender.status == "open",
+            Tender.approval_status == "approved",
+        )
+        .order_by(Tender.closing_date, Tender.closing_time)
+        .all()
+    )
+    return tenders
+
 @router.get("/{tender_id}", response_model=TenderResponse)
 def get_tender(
     tender_id: int,
+    response: Response,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_db)
 ):
@@ -71,12 +105,15 @@ def get_tender(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tender not found"
         )
+    response.headers["ETag"] = etag(tender.version)
     return tender
 
 @router.put("/{tender_id}", response_model=TenderResponse)
 def update_tender(
     tender_id: int,
     tender_data: TenderCreateRequest,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_db)
 ):
@@ -94,6 +131,8 @@ def update_tender(
             detail="Not authorized to update this tender"
         )
     
+    check_if_match(if_match, tender.version)
+    
     # Update tender fields
     tender.title = tender_data.title
     tender.service_type = tender_data.service_type
@@ -111,13 +150,16 @@ def update_tender(
     tender.contact_email = tender_data.contact_email
     tender.contact_phone = tender_data.contact_phone
     tender.required_licenses = tender_data.required_licenses
+    set_tender_licenses(tender, tender_data.required_licenses)
     tender.evaluation_criteria = [criteria.model_dump() for criteria in tender_data.evaluation_criteria]
     tender.tender_fee = tender_data.tender_fee
     tender.tender_documents = tender_data.tender_documents
     
-    session.commit()
+    commit_or_conflict(session)
     session.refresh(tender)
+    tender_index.upsert(tender)
     
+    response.headers["ETag"] = etag(tender.version)
     return tender
 
 @router.put("/{tender_id}/approval")
@@ -149,10 +191,42 @@ def update_tender_approval(
             detail="Invalid approval status. Must be 'approved' or 'rejected'"
         )
     
+    previous_status = tender.approval_status
     tender.approval_status = approval_status
     
-    session.commit()
+    # Notify the tender owner
+    if approval_status != previous_status:
+        enqueue_email(
+            session,
+            tender.contact_email,
+            f"Your tender \"{tender.title}\" has been {approval_status}",
+            f"An administrator has {approval_status} your tender \"{tender.title}\".",
+        )
+    commit_or_conflict(session)
     session.refresh(tender)
+    tender_index.upsert(tender)
+    if approval_status != previous_status:
+        audit_writer.record("tender", tender.id, "approval_status", previous_status, approval_status, current_user.id)
     
     return {"message": f"Tender {approval_status} successfully", "tender": tender}
 
+@router.get("/{tender_id}/history", response_model=List[AuditEventResponse])
+def get_tender_history(
+    tender_id: int,
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_db)
+):
+    tender = session.query(Tender).filter(Tender.id == tender_id).first()
+    if not tender:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tender not found"
+        )
+    
+    if tender.user_id != current_user.id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view the history of this tender"
+        )
+    
+    return get_history(session, "tender", tender_id)
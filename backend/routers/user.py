@@ -2,44 +2,58 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordRequestForm
 from database.connection import get_db
-from passlib.context import CryptContext
-from datetime import datetime, timedelta
-from jose import jwt
-from dotenv import load_dotenv
-import os
-
-load_dotenv()
+from functools import lru_cache
 
 from database.models.user import User
-from database.schemas.user import UserSchema, UserListResponse, LoginResponse, RegisterResponse, RegisterRequest, RegisterUpdateRequest
+from database.schemas.user import UserSchema, UserListResponse, LoginResponse, RegisterResponse, RegisterRequest, RegisterUpdateRequest, RefreshRequest, RefreshResponse, UserLicensesRequest, UserLicensesResponse
+from database.models.license import UserLicense
+from matching import normalize_license, user_licenses
 import json
 from dependencies import get_current_user
+from audit import audit_writer
+from tokens import create_access_token, create_refresh_token, decode_token, REFRESH_TOKEN_TYPE
 
 router = APIRouter()
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
-SECRET_KEY = os.getenv("SECRET_KEY")
-ALGORITHM = os.getenv("ALGORITHM")
-ACCESS_TOKEN_EXPIRE_MINUTES = 60
+@lru_cache
+def get_pwd_context():
+    # passlib/argon2 are comparatively slow to import, so the context is
+    # built on the first login/register rather than at worker start-up.
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["argon2"], deprecated="auto")
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 def verify_password(password: str, hashed: str) -> bool:
-    return pwd_context.verify(password, hashed)
-
-def create_access_token(data: dict):
-    to_encode = data.copy()
-    expire = datetime.now() + timedelta(
-        minutes=ACCESS_TOKEN_EXPIRE_MINUTES
-    )
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return get_pwd_context().verify(password, hashed)
 
 @router.get("/me", response_model=UserSchema)
 def read_users_me(current_user: User = Depends(get_current_user)):
     return current_user
 
+@router.get("/me/licenses", response_model=UserLicensesResponse)
+def read_my_licenses(
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_db)
+):
+    return {"licenses": sorted(user_licenses(session, current_user))}
+
+@router.put("/me/licenses", response_model=UserLicensesResponse)
+def update_my_licenses(
+    data: UserLicensesRequest,
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_db)
+):
+    licenses = {normalize_license(name) for name in data.licenses if name.strip()}
+    
+    session.query(UserLicense).filter(UserLicense.user_id == current_user.id).delete()
+    session.add_all(UserLicense(user_id=current_user.id, license=name) for name in licenses)
+    session.commit()
+    
+    return {"licenses": sorted(licenses)}
+
 @router.get("/", response_model=UserListResponse)
 def user_list(session: Session = Depends(get_db)):
     try:
@@ -78,6 +92,40 @@ def login(
             detail="Invalid email or password 2"
         )
 
+    claims = {
+        "sub": str(user.id),
+        "role": user.role
+    }
+
+    return {
+        "access_token": create_access_token(data=claims),
+        "refresh_token": create_refresh_token(data=claims),
+        "user": user
+    }
+
+@router.post("/refresh", response_model=RefreshResponse)
+def refresh(
+    data: RefreshRequest,
+    session: Session = Depends(get_db)
+):
+    from jose import JWTError
+
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    try:
+        payload = decode_token(data.refresh_token, REFRESH_TOKEN_TYPE)
+        user_id = int(payload.get("sub"))
+    except (JWTError, ValueError, TypeError):
+        raise credentials_exception
+
+    # Re-read the user so a changed role or deleted account takes effect
+    user = session.query(User).filter(User.id == user_id).first()
+    if not user:
+        raise credentials_exception
+
     access_token = create_access_token(
         data={
             "sub": str(user.id),
@@ -85,10 +133,7 @@ def login(
         }
     )
 
-    return {
-        "access_token": access_token,
-        "user": user
-    }
+    return {"access_token": access_token}
 
 @router.post("/register", response_model=RegisterResponse)
 def register(
@@ -144,6 +189,7 @@ def update_register(
         )
 
     # Update remark and status
+    previous_status = user.status
     if isinstance(data.remark, dict):
         user.remark = json.dumps(data.remark)
     else:
@@ -153,6 +199,7 @@ def update_register(
     
     session.commit()
     session.refresh(user)
+    audit_writer.record("user", user.id, "status", previous_status, user.status)
     
     return user
 
@@ -0,0 +1,110 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+import hashlib
+import threading
+import time
+
+from config import get_settings
+
+ACCESS_TOKEN_TYPE = "access"
+REFRESH_TOKEN_TYPE = "refresh"
+
+
+class TokenCache:
+    """Bounded LRU of already-verified token claims, keyed by a digest of the token.
+
+    Only tokens that passed signature verification are stored, and a cached
+    entry is dropped as soon as its `exp` claim has passed.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str):
+        key = self._key(token)
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                return None
+            if payload["exp"] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def put(self, token: str, payload: dict):
+        if self.maxsize <= 0 or "exp" not in payload:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_token_cache = None
+
+def get_token_cache() -> TokenCache:
+    global _token_cache
+    if _token_cache is None:
+        _token_cache = TokenCache(get_settings().token_cache_size)
+    return _token_cache
+
+def _signing_key(settings):
+    if settings.algorithm.startswith("HS"):
+        return settings.secret_key
+    return settings.jwt_private_key
+
+def _verification_key(settings):
+    if settings.algorithm.startswith("HS"):
+        return settings.secret_key
+    return settings.jwt_public_key
+
+def _create_token(data: dict, token_type: str, expires_delta: timedelta) -> str:
+    from jose import jwt
+
+    settings = get_settings()
+    to_encode = data.copy()
+    expire = datetime.now(timezone.utc) + expires_delta
+    to_encode.update({"exp": expire, "type": token_type})
+    return jwt.encode(to_encode, _signing_key(settings), algorithm=settings.algorithm)
+
+def create_access_token(data: dict) -> str:
+    minutes = get_settings().access_token_expire_minutes
+    return _create_token(data, ACCESS_TOKEN_TYPE, timedelta(minutes=minutes))
+
+def create_refresh_token(data: dict) -> str:
+    days = get_settings().refresh_token_expire_days
+    return _create_token(data, REFRESH_TOKEN_TYPE, timedelta(days=days))
+
+def decode_token(token: str, token_type: str = ACCESS_TOKEN_TYPE) -> dict:
+    """Verify `token` and return its claims, raising jose.JWTError if it is invalid.
+
+    Access tokens are served from the verification cache when possible.
+    Tokens issued before refresh tokens existed carry no `type` claim and are
+    treated as access tokens.
+    """
+    from jose import JWTError, jwt
+
+    cache = get_token_cache() if token_type == ACCESS_TOKEN_TYPE else None
+    payload = cache.get(token) if cache else None
+    if payload is None:
+        settings = get_settings()
+        payload = jwt.decode(token, _verification_key(settings), algorithms=[settings.algorithm])
+        if cache:
+            cache.put(token, payload)
+
+    if payload.get("type", ACCESS_TOKEN_TYPE) != token_type:
+        raise JWTError("Unexpected token type")
+    return payload
@@ -16,6 +16,7 @@ import {
 import Button from "@/components/ui/button/Button";
 import StatCard from "@/components/shared/StatCard";
 import { API_BASE_URL } from "@/config";
+import { apiFetch } from "@/lib/api";
 
 interface Tender {
   id: number;
@@ -49,7 +50,7 @@ export default function AdminDashboard() {
         return;
       }
 
-      const response = await fetch(`${API_BASE_URL}/tenders/`, {
+      const response = await apiFetch(`${API_BASE_URL}/tenders/`, {
         headers: {
           "Authorization": `Bearer ${token}`,
           "Content-Type": "application/json"
@@ -77,7 +78,7 @@ export default function AdminDashboard() {
         return;
       }
 
-      const response = await fetch(`${API_BASE_URL}/tenders/${tenderId}/approval`, {
+      const response = await apiFetch(`${API_BASE_URL}/tenders/${tenderId}/approval`, {
         method: "PUT",
         headers: {
           "Authorization": `Bearer ${token}`,
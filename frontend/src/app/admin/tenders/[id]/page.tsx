@@ -4,6 +4,7 @@ import { useRouter, useParams } from "next/navigation";
 import { CircleCheck, CircleX, MapPin, CalendarDays, CircleDollarSign, FileText } from "lucide-react";
 import Button from "@/components/ui/button/Button";
 import { API_BASE_URL } from "@/config";
+import { apiFetch } from "@/lib/api";
 
 interface Tender {
   id: number;
@@ -42,7 +43,7 @@ export default function AdminTenderDetail() {
         return;
       }
 
-      const response = await fetch(`${API_BASE_URL}/tenders/${tenderId}`, {
+      const response = await apiFetch(`${API_BASE_URL}/tenders/${tenderId}`, {
         headers: {
           "Authorization": `Bearer ${token}`,
           "Content-Type": "application/json"
@@ -72,7 +73,7 @@ export default function AdminTenderDetail() {
         return;
       }
 
-      const response = await fetch(`${API_BASE_URL}/tenders/${tender.id}/approval`, {
+      const response = await apiFetch(`${API_BASE_URL}/tenders/${tender.id}/approval`, {
         method: "PUT",
         headers: {
           "Authorization": `Bearer ${token}`,
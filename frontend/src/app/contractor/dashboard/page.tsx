@@ -14,6 +14,7 @@ import Badge from "@/components/ui/badge/Badge";
 import StatCard from "@/components/shared/StatCard";
 import ActionCard from "@/components/shared/ActionCard";
 import { API_BASE_URL } from "@/config";
+import { apiFetch } from "@/lib/api";
 
 interface Tender {
   id: number;
@@ -57,7 +58,7 @@ export default function ContractorDashboard() {
       }
 
       // Fetch available tenders
-      const tendersResponse = await fetch(`${API_BASE_URL}/tenders/`, {
+      const tendersResponse = await apiFetch(`${API_BASE_URL}/tenders/`, {
         headers: {
           "Authorization": `Bearer ${token}`,
           "Content-Type": "application/json"
@@ -73,7 +74,7 @@ export default function ContractorDashboard() {
       }
 
       // Fetch my bids
-      const bidsResponse = await fetch(`${API_BASE_URL}/bids/my-bids`, {
+      const bidsResponse = await apiFetch(`${API_BASE_URL}/bids/my-bids`, {
         headers: {
           "Authorization": `Bearer ${token}`,
           "Content-Type": "application/json"
@@ -4,6 +4,7 @@ import Link from "next/link";
 import { useRouter } from "next/navigation";
 import Button from "@/components/ui/button/Button";
 import { API_BASE_URL } from "@/config";
+import { apiFetch } from "@/lib/api";
 
 interface Bid {
   id: number;
@@ -38,7 +39,7 @@ export default function ContractorMyBidsPage() {
         return;
       }
 
-      const response = await fetch(`${API_BASE_URL}/bids/my-bids`, {
+      const response = await apiFetch(`${API_BASE_URL}/bids/my-bids`, {
         headers: {
           "Authorization": `Bearer ${token}`,
           "Content-Type": "application/json"
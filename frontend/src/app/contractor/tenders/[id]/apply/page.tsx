@@ -6,6 +6,7 @@ import { ChevronLeftIcon } from "@/icons";
 import Button from "@/components/ui/button/Button";
 import Input from "@/components/form/input/InputField";
 import { API_BASE_URL } from "@/config";
+import { apiFetch } from "@/lib/api";
 
 interface TenderData {
   id: number;
@@ -46,7 +47,7 @@ export default function ApplyBidPage() {
         return;
       }
 
-      const response = await fetch(`${API_BASE_URL}/tenders/${tenderId}`, {
+      const response = await apiFetch(`${API_BASE_URL}/tenders/${tenderId}`, {
         headers: {
           "Authorization": `Bearer ${token}`,
           "Content-Type": "application/json"
@@ -107,7 +108,7 @@ export default function ApplyBidPage() {
         proposal_document: formData.proposal_document || undefined
       };
 
-      const response = await fetch(`${API_BASE_URL}/bids/`, {
+      const response = await apiFetch(`${API_BASE_URL}/bids/`, {
         method: "POST",
         headers: {
           "Authorization": `Bearer ${token}`,
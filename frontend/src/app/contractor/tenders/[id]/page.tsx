@@ -5,6 +5,7 @@ import { useRouter, useParams } from "next/navigation";
 import { ChevronLeftIcon } from "@/icons";
 import Button from "@/components/ui/button/Button";
 import { API_BASE_URL } from "@/config";
+import { apiFetch } from "@/lib/api";
 
 interface EvaluationCriteria {
   criteria: string;
@@ -57,7 +58,7 @@ export default function ContractorTenderDetailsPage() {
         return;
       }
 
-      const response = await fetch(`${API_BASE_URL}/tenders/${tenderId}`, {
+      const response = await apiFetch(`${API_BASE_URL}/tenders/${tenderId}`, {
         headers: {
           "Authorization": `Bearer ${token}`,
           "Content-Type": "application/json"
@@ -82,7 +83,7 @@ export default function ContractorTenderDetailsPage() {
       const token = localStorage.getItem("access_token");
       if (!token) return;
 
-      const response = await fetch(`${API_BASE_URL}/bids/my-bids`, {
+      const response = await apiFetch(`${API_BASE_URL}/bids/my-bids`, {
         headers: {
           "Authorization": `Bearer ${token}`,
           "Content-Type": "application/json"
@@ -1,5 +1,6 @@
 "use client";
 import { API_BASE_URL } from "@/config";
+import { apiFetch } from "@/lib/api";
 import React, { useEffect, useState } from "react";
 import Link from "next/link";
 import { useRouter } from "next/navigation";
@@ -39,7 +40,7 @@ export default function ContractorTendersPage() {
         return;
       }
 
-      const response = await fetch(`${API_BASE_URL}/tenders/`, {
+      const response = await apiFetch(`${API_BASE_URL}/tenders/`, {
         headers: {
           "Authorization": `Bearer ${token}`,
           "Content-Type": "application/json"
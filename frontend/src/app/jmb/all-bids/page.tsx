@@ -5,6 +5,7 @@ import { useRouter } from "next/navigation";
 import { CircleCheck, Eye, CircleX } from "lucide-react";
 import Button from "@/components/ui/button/Button";
 import { API_BASE_URL } from "@/config";
+import { apiFetch } from "@/lib/api";
 
 interface Bid {
   id: number;
@@ -18,6 +19,7 @@ interface Bid {
   proposal_document?: string;
   cover_letter?: string;
   status: string;
+  version: number;
   created_at: string;
   tender: {
     title: string;
@@ -56,7 +58,7 @@ export default function AllBidsPage() {
       const userId = payload.sub;
 
       // Fetch all tenders for this user
-      const tendersResponse = await fetch(`${API_BASE_URL}/tenders/`, {
+      const tendersResponse = await apiFetch(`${API_BASE_URL}/tenders/`, {
         headers: {
           "Authorization": `Bearer ${token}`,
           "Content-Type": "application/json"
@@ -69,7 +71,7 @@ export default function AllBidsPage() {
 
         // Fetch bids for each tender
         const allBidsPromises = myTenders.map((tender: any) =>
-          fetch(`${API_BASE_URL}/bids/tender/${tender.id}`, {
+          apiFetch(`${API_BASE_URL}/bids/tender/${tender.id}`, {
             headers: {
               "Authorization": `Bearer ${token}`,
               "Content-Type": "application/json"
@@ -90,6 +92,7 @@ export default function AllBidsPage() {
 
   const handleUpdateBidStatus = async (bidId: number, status: string) => {
     try {
+      const bid = bids.find((b) => b.id === bidId);
       setUpdatingBidId(bidId);
       const token = localStorage.getItem("access_token");
       if (!token) {
@@ -97,16 +100,20 @@ export default function AllBidsPage() {
         return;
       }
 
-      const response = await fetch(`${API_BASE_URL}/bids/${bidId}/status`, {
+      const response = await apiFetch(`${API_BASE_URL}/bids/${bidId}/status`, {
         method: "PUT",
         headers: {
           "Authorization": `Bearer ${token}`,
-          "Content-Type": "application/json"
+          "Content-Type": "application/json",
+          "If-Match": `"${bid?.version}"`
         },
         body: JSON.stringify({ status })
       });
 
-      if (response.ok) {
+      if (response.status === 409 || response.status === 412 || response.status === 428) {
+        alert("This bid was changed by someone else. The latest version has been loaded, please try again.");
+        await fetchAllBids();
+      } else if (response.ok) {
         await fetchAllBids();
         alert(`Bid ${status} successfully!`);
       } else {
@@ -9,6 +9,7 @@ import TextArea from "@/components/form/input/TextArea";
 import Button from "@/components/ui/button/Button";
 import Stepper, { Step } from "@/components/ui/stepper/Stepper";
 import { API_BASE_URL } from "@/config";
+import { apiFetch, clearTokens } from "@/lib/api";
 
 interface EvaluationCriteria {
   criteria: string;
@@ -186,14 +187,14 @@ export default function CreateTenderPage() {
       }
 
       // Verify token is still valid before submitting
-      const verifyResponse = await fetch(`${API_BASE_URL}/users/me`, {
+      const verifyResponse = await apiFetch(`${API_BASE_URL}/users/me`, {
         headers: {
           Authorization: `Bearer ${token}`,
         },
       });
 
       if (!verifyResponse.ok) {
-        localStorage.removeItem("access_token");
+        clearTokens();
         localStorage.removeItem("user_email");
         alert("Your session has expired. Please login again.");
         router.push("/signin");
@@ -213,7 +214,7 @@ export default function CreateTenderPage() {
         site_visit_time: formData.site_visit_time || null,
       };
 
-      const response = await fetch(`${API_BASE_URL}/tenders/create`, {
+      const response = await apiFetch(`${API_BASE_URL}/tenders/create`, {
         method: "POST",
         headers: {
           "Content-Type": "application/json",
@@ -231,7 +232,7 @@ export default function CreateTenderPage() {
         
         // If unauthorized, clear token and redirect to login
         if (response.status === 401) {
-          localStorage.removeItem("access_token");
+          clearTokens();
           localStorage.removeItem("user_email");
           alert("Your session has expired. Please login again.");
           router.push("/signin");
@@ -25,6 +25,7 @@ interface Tender {
 }
 
 import { API_BASE_URL } from "@/config";
+import { apiFetch } from "@/lib/api";
 
 export default function JMBDashboard() {
   const [tenders, setTenders] = useState<Tender[]>([]);
@@ -48,7 +49,7 @@ export default function JMBDashboard() {
         return;
       }
 
-      const response = await fetch(`${API_BASE_URL}/tenders/`, {
+      const response = await apiFetch(`${API_BASE_URL}/tenders/`, {
         headers: {
           "Authorization": `Bearer ${token}`,
           "Content-Type": "application/json"
@@ -7,6 +7,7 @@ import { Plus, Pencil, Eye, CalendarDays, CircleDollarSign } from 'lucide-react'
 import Input from "@/components/form/input/InputField";
 import Button from "@/components/ui/button/Button";
 import { API_BASE_URL } from "@/config";
+import { apiFetch } from "@/lib/api";
 
 interface Tender {
   id: number;
@@ -64,7 +65,7 @@ export default function MyTendersPage() {
       // Quick fix: Let's fetch all and filter client side if necessary, OR better:
       // Let's decode the token to get the user ID? The token has `sub` which is user_id.
       
-      const response = await fetch(`${API_BASE_URL}/tenders/`, {
+      const response = await apiFetch(`${API_BASE_URL}/tenders/`, {
         headers: {
             "Authorization": `Bearer ${token}`
         }
@@ -113,7 +114,7 @@ export default function MyTendersPage() {
     
     for (const tender of tenderList) {
       try {
-        const response = await fetch(`${API_BASE_URL}/bids/tender/${tender.id}`, {
+        const response = await apiFetch(`${API_BASE_URL}/bids/tender/${tender.id}`, {
           headers: {
             "Authorization": `Bearer ${token}`,
             "Content-Type": "application/json"
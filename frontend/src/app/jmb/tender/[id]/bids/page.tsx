@@ -17,6 +17,7 @@ interface Bid {
   company_registration?: string;
   years_of_experience?: number;
   status: string;
+  version: number;
   created_at: string;
   updated_at: string;
 }
@@ -30,6 +31,7 @@ interface Tender {
 }
 
 import { API_BASE_URL } from "@/config";
+import { apiFetch } from "@/lib/api";
 
 export default function TenderBidsPage() {
   const router = useRouter();
@@ -56,7 +58,7 @@ export default function TenderBidsPage() {
       }
 
       // Fetch tender details
-      const tenderResponse = await fetch(`${API_BASE_URL}/tenders/${tenderId}`, {
+      const tenderResponse = await apiFetch(`${API_BASE_URL}/tenders/${tenderId}`, {
         headers: {
           "Authorization": `Bearer ${token}`,
           "Content-Type": "application/json"
@@ -69,7 +71,7 @@ export default function TenderBidsPage() {
       }
 
       // Fetch bids
-      const bidsResponse = await fetch(`${API_BASE_URL}/bids/tender/${tenderId}`, {
+      const bidsResponse = await apiFetch(`${API_BASE_URL}/bids/tender/${tenderId}`, {
         headers: {
           "Authorization": `Bearer ${token}`,
           "Content-Type": "application/json"
@@ -91,6 +93,7 @@ export default function TenderBidsPage() {
 
   const handleUpdateBidStatus = async (bidId: number, status: string) => {
     try {
+      const bid = bids.find((b) => b.id === bidId);
       setUpdatingBidId(bidId);
       const token = localStorage.getItem("access_token");
       if (!token) {
@@ -98,16 +101,20 @@ export default function TenderBidsPage() {
         return;
       }
 
-      const response = await fetch(`${API_BASE_URL}/bids/${bidId}/status`, {
+      const response = await apiFetch(`${API_BASE_URL}/bids/${bidId}/status`, {
         method: "PUT",
         headers: {
           "Authorization": `Bearer ${token}`,
-          "Content-Type": "application/json"
+          "Content-Type": "application/json",
+          "If-Match": `"${bid?.version}"`
         },
         body: JSON.stringify({ status })
       });
 
-      if (response.ok) {
+      if (response.status === 409 || response.status === 412 || response.status === 428) {
+        alert("This bid was changed by someone else. The latest version has been loaded, please try again.");
+        await fetchTenderAndBids();
+      } else if (response.ok) {
         // Refresh bids
         await fetchTenderAndBids();
         alert(`Bid ${status} successfully!`);
@@ -36,9 +36,11 @@ interface TenderData {
   evaluation_criteria: EvaluationCriteria[];
   tender_fee?: number;
   tender_documents?: string[];
+  version: number;
 }
 
 import { API_BASE_URL } from "@/config";
+import { apiFetch } from "@/lib/api";
 
 export default function TenderDetails() {
   const router = useRouter();
@@ -88,7 +90,7 @@ export default function TenderDetails() {
         return;
       }
 
-      const response = await fetch(`${API_BASE_URL}/tenders/${tenderId}`, {
+      const response = await apiFetch(`${API_BASE_URL}/tenders/${tenderId}`, {
         headers: {
           "Authorization": `Bearer ${token}`,
           "Content-Type": "application/json"
@@ -193,7 +195,7 @@ export default function TenderDetails() {
       }
 
       // Verify token is still valid
-      const verifyResponse = await fetch(`${API_BASE_URL}/users/me`, {
+      const verifyResponse = await apiFetch(`${API_BASE_URL}/users/me`, {
         headers: {
           "Authorization": `Bearer ${token}`,
         },
@@ -227,16 +229,20 @@ export default function TenderDetails() {
         tender_documents: [],
       };
 
-      const response = await fetch(`${API_BASE_URL}/tenders/${tenderId}`, {
+      const response = await apiFetch(`${API_BASE_URL}/tenders/${tenderId}`, {
         method: "PUT",
         headers: {
           "Authorization": `Bearer ${token}`,
-          "Content-Type": "application/json"
+          "Content-Type": "application/json",
+          "If-Match": `"${tender?.version}"`
         },
         body: JSON.stringify(payload)
       });
 
-      if (response.ok) {
+      if (response.status === 409 || response.status === 412 || response.status === 428) {
+        alert("This tender was changed by someone else. The latest version has been loaded, please review it and save again.");
+        await fetchTenderDetails();
+      } else if (response.ok) {
         const updatedTender = await response.json();
         setTender(updatedTender);
         alert("Tender updated successfully!");
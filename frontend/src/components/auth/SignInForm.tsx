@@ -9,6 +9,7 @@ import { useRouter } from "next/navigation";
 import React, { useState } from "react";
 
 import { API_BASE_URL } from "@/config";
+import { storeTokens } from "@/lib/api";
 
 export default function SignInForm() {
   const router = useRouter();
@@ -57,7 +58,7 @@ export default function SignInForm() {
         
         // Store auth details
         if (typeof window !== "undefined") {
-          localStorage.setItem("access_token", data.access_token);
+          storeTokens(data.access_token, data.refresh_token);
           // Store email for sidebar display (consistent with registration flow)
           localStorage.setItem("user_email", data.user.email);
         }
@@ -5,6 +5,7 @@ import React, { useState, useEffect } from "react";
 import { Dropdown } from "../ui/dropdown/Dropdown";
 import { DropdownItem } from "../ui/dropdown/DropdownItem";
 import { API_BASE_URL } from "@/config";
+import { apiFetch, clearTokens } from "@/lib/api";
 
 interface UserData {
   id: number;
@@ -30,7 +31,7 @@ export default function UserDropdown() {
         return;
       }
 
-      const response = await fetch(`${API_BASE_URL}/users/me`, {
+      const response = await apiFetch(`${API_BASE_URL}/users/me`, {
         headers: {
           "Authorization": `Bearer ${token}`,
           "Content-Type": "application/json"
@@ -193,6 +194,7 @@ function toggleDropdown(e: React.MouseEvent<HTMLButtonElement, MouseEvent>) {
         </ul>
         <Link
           href="/signin"
+          onClick={clearTokens}
           className="flex items-center gap-3 px-3 py-2 mt-3 font-medium text-gray-700 rounded-lg group text-theme-sm hover:bg-gray-100 hover:text-gray-700 dark:text-gray-400 dark:hover:bg-white/5 dark:hover:text-gray-300"
         >
           <svg
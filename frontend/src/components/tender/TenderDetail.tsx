@@ -18,6 +18,7 @@ import {
 
 import Button from "@/components/ui/button/Button";
 import { API_BASE_URL } from "@/config";
+import { apiFetch } from "@/lib/api";
 
 interface EvaluationCriterion {
   criteria: string;
@@ -75,7 +76,7 @@ export default function TenderDetail({ tenderId, backUrl, backLabel, userType }:
         return;
       }
 
-      const response = await fetch(`${API_BASE_URL}/tenders/${id}`, {
+      const response = await apiFetch(`${API_BASE_URL}/tenders/${id}`, {
         headers: {
           "Authorization": `Bearer ${token}`,
         },
@@ -6,6 +6,7 @@ import { useSidebar } from "@/context/SidebarContext";
 import { ArrowRightIcon } from "@/icons/index";
 import { LayoutDashboard, ShieldCheck } from "lucide-react";
 import { API_BASE_URL } from "@/config";
+import { apiFetch, clearTokens } from "@/lib/api";
 
 type NavItem = {
   name: string;
@@ -44,7 +45,7 @@ const AdminSidebar: React.FC = () => {
       const token = localStorage.getItem("access_token");
       if (!token) return;
 
-      const response = await fetch(`${API_BASE_URL}/users/me`, {
+      const response = await apiFetch(`${API_BASE_URL}/users/me`, {
         headers: {
           "Authorization": `Bearer ${token}`,
           "Content-Type": "application/json"
@@ -141,6 +142,7 @@ const AdminSidebar: React.FC = () => {
           )}
           <Link
             href="/signin"
+            onClick={clearTokens}
             className={`flex items-center gap-2.5 rounded-lg px-4 py-2 font-medium text-gray-700 hover:bg-gray-100 dark:text-gray-400 dark:hover:bg-white/5 ${
               isExpanded || isHovered ? "" : "justify-center"
             }`}
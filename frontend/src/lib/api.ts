@@ -0,0 +1,62 @@
+import { API_BASE_URL } from "@/config";
+
+// Access tokens are short-lived. When a request comes back 401, exchange the
+// stored refresh token for a new access token and retry the request once.
+// Concurrent 401s share one refresh call.
+let refreshing: Promise<string | null> | null = null;
+
+export function storeTokens(accessToken: string, refreshToken?: string) {
+  localStorage.setItem("access_token", accessToken);
+  if (refreshToken) {
+    localStorage.setItem("refresh_token", refreshToken);
+  }
+}
+
+export function clearTokens() {
+  localStorage.removeItem("access_token");
+  localStorage.removeItem("refresh_token");
+}
+
+async function refreshAccessToken(): Promise<string | null> {
+  const refreshToken = localStorage.getItem("refresh_token");
+  if (!refreshToken) {
+    return null;
+  }
+  try {
+    const response = await fetch(`${API_BASE_URL}/users/refresh`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ refresh_token: refreshToken }),
+    });
+    if (!response.ok) {
+      clearTokens();
+      return null;
+    }
+    const data = await response.json();
+    storeTokens(data.access_token);
+    return data.access_token;
+  } catch (error) {
+    console.error("Error refreshing access token:", error);
+    return null;
+  }
+}
+
+export async function apiFetch(url: string, init: RequestInit = {}): Promise<Response> {
+  const response = await fetch(url, init);
+  const headers = new Headers(init.headers);
+  if (response.status !== 401 || !headers.has("Authorization")) {
+    return response;
+  }
+
+  if (!refreshing) {
+    refreshing = refreshAccessToken().finally(() => {
+      refreshing = null;
+    });
+  }
+  const accessToken = await refreshing;
+  if (!accessToken) {
+    return response;
+  }
+  headers.set("Authorization", `Bearer ${accessToken}`);
+  return fetch(url, { ...init, headers });
+}